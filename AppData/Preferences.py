@@ -208,13 +208,29 @@ class Temp(Serializable):
 class Download(Serializable):
     def __init__(self):
         self._downloadSpeed = 20
+        self._adaptiveDownloadSpeed = False
+        self._bandwidthLimit = 0
+        self._downloadBandwidthLimit = 0
+        self._bandwidthLimitSchedule = []
 
     def __setup__(self):
         App.FileDownloadManager.setPoolSize(self._downloadSpeed)
+        App.FileDownloadManager.setAdaptivePoolSizeEnabled(self._adaptiveDownloadSpeed)
+        App.FileDownloadManager.getBandwidthLimiter().setRate(self._bandwidthLimit)
+        App.FileDownloadManager.getBandwidthLimiter().setDownloadRate(self._downloadBandwidthLimit)
+        App.FileDownloadManager.getBandwidthLimiter().setSchedule(self._bandwidthLimitSchedule)
         del self._downloadSpeed
+        del self._adaptiveDownloadSpeed
+        del self._bandwidthLimit
+        del self._downloadBandwidthLimit
+        del self._bandwidthLimitSchedule
 
     def __save__(self):
         self._downloadSpeed = App.FileDownloadManager.getPoolSize()
+        self._adaptiveDownloadSpeed = App.FileDownloadManager.isAdaptivePoolSizeEnabled()
+        self._bandwidthLimit = App.FileDownloadManager.getBandwidthLimiter().getRate()
+        self._downloadBandwidthLimit = App.FileDownloadManager.getBandwidthLimiter().getDownloadRate()
+        self._bandwidthLimitSchedule = App.FileDownloadManager.getBandwidthLimiter().getSchedule()
         return super().__save__()
 
 
@@ -67,6 +67,9 @@ Account = _TwitchAccount(parent=Instance)
 from Services.Theme.ThemeManager import ThemeManager as _ThemeManager
 ThemeManager = _ThemeManager(parent=Instance)
 
+from Download.Downloader.Core.Engine.File.ConnectionPool import ConnectionPool as _ConnectionPool
+ConnectionPool = _ConnectionPool(parent=Instance)
+
 from Download.Downloader.Core.Engine.File.FileDownloadManager import FileDownloadManager as _FileDownloadManager
 FileDownloadManager = _FileDownloadManager(parent=Instance)
 
@@ -12,6 +12,9 @@ class _QNetworkAccessManager(QtNetwork.QNetworkAccessManager):
     def get(self, request: QtNetwork.QNetworkRequest) -> SafeNetworkReply:
         return SafeNetworkReply(request, super().get(request), parent=self)
 
+    def head(self, request: QtNetwork.QNetworkRequest) -> SafeNetworkReply:
+        return SafeNetworkReply(request, super().head(request), parent=self)
+
     def post(self, request: QtNetwork.QNetworkRequest, data: QtCore.QByteArray) -> SafeNetworkReply:
         return SafeNetworkReply(request, super().post(request, data), parent=self)
 QtNetwork.QNetworkAccessManager = _QNetworkAccessManager #Direct Class Patch - [Warning] Does not affect embedded objects (Use with caution)
\ No newline at end of file
@@ -5,6 +5,7 @@ import typing
 
 class SafeNetworkReply(QtCore.QObject):
     _internalRuntimeError = QtCore.pyqtSignal()
+    metaDataChanged = QtCore.pyqtSignal()
     readyRead = QtCore.pyqtSignal()
     downloadProgress = QtCore.pyqtSignal(object, object)
     errorOccurred = QtCore.pyqtSignal(QtNetwork.QNetworkReply.NetworkError)
@@ -22,6 +23,7 @@ class SafeNetworkReply(QtCore.QObject):
             if self._reply.isFinished():
                 self._replyFinished()
             else:
+                self._reply.metaDataChanged.connect(self._replyMetaDataChanged)
                 self._reply.readyRead.connect(self._replyReadyRead)
                 self._reply.downloadProgress.connect(self._replyDownloadProgress)
                 self._reply.errorOccurred.connect(self._replyErrorOccurred)
@@ -29,6 +31,10 @@ class SafeNetworkReply(QtCore.QObject):
         except RuntimeError as e:
             self._handleRuntimeError(e)
 
+    def _replyMetaDataChanged(self) -> None:
+        if not self._finished:
+            self.metaDataChanged.emit()
+
     def _replyReadyRead(self) -> None:
         if not self._finished:
             self.readyRead.emit()
@@ -72,6 +78,53 @@ class SafeNetworkReply(QtCore.QObject):
                 self._handleRuntimeError(e)
         return None
 
+    def header(self, header: QtNetwork.QNetworkRequest.KnownHeaders) -> typing.Any:
+        if not self._hasRuntimeError():
+            try:
+                return self._reply.header(header)
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+        return None
+
+    def hasRawHeader(self, headerName: bytes | QtCore.QByteArray) -> bool:
+        if not self._hasRuntimeError():
+            try:
+                return self._reply.hasRawHeader(headerName)
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+        return False
+
+    def rawHeader(self, headerName: bytes | QtCore.QByteArray) -> QtCore.QByteArray:
+        if not self._hasRuntimeError():
+            try:
+                return self._reply.rawHeader(headerName)
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+        return QtCore.QByteArray()
+
+    def setReadBufferSize(self, size: int) -> None:
+        if not self._hasRuntimeError():
+            try:
+                self._reply.setReadBufferSize(size)
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+
+    def bytesAvailable(self) -> int:
+        if not self._hasRuntimeError():
+            try:
+                return self._reply.bytesAvailable()
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+        return 0
+
+    def read(self, maxSize: int) -> bytes:
+        if not self._hasRuntimeError():
+            try:
+                return self._reply.read(maxSize)
+            except RuntimeError as e:
+                self._handleRuntimeError(e)
+        return b""
+
     def readAll(self) -> QtCore.QByteArray:
         if not self._hasRuntimeError():
             try:
@@ -51,6 +51,7 @@ class DownloadInfo(Serializable):
             self.updateTrack = self.optionHistory.isUpdateTrackEnabled()
             self.prioritize = False
             self.remux = self.optionHistory.isRemuxEnabled()
+            self.resume = False
         elif self.type.isClip():
             self.prioritize = False
         self.directory = self.optionHistory.getUpdatedDirectory()
@@ -148,6 +149,9 @@ class DownloadInfo(Serializable):
     def setRemuxEnabled(self, enabled: bool) -> None:
         self.remux = enabled
 
+    def setResumeEnabled(self, enabled: bool) -> None:
+        self.resume = enabled
+
     def isUnmuteVideoEnabled(self) -> bool:
         return self.unmuteVideo
 
@@ -163,6 +167,9 @@ class DownloadInfo(Serializable):
     def isRemuxEnabled(self) -> bool:
         return self.remux
 
+    def isResumeEnabled(self) -> bool:
+        return self.resume
+
     def saveOptionHistory(self) -> None:
         self.optionHistory.setDirectory(self.directory)
         if self.resolution.isAudioOnly():
@@ -1,10 +1,11 @@
+from Core import App
 from Core.Config import Config
 from Core.GlobalExceptions import Exceptions
 from Services.Logging.Logger import Logger
 from Download.DownloadInfo import DownloadInfo
 from Download.Downloader.Core.Engine import Modules
 
-from PyQt6 import QtCore, QtNetwork
+from PyQt6 import QtCore
 
 
 class BaseEngine(QtCore.QObject):
@@ -16,8 +17,11 @@ class BaseEngine(QtCore.QObject):
         self.status = status
         self.progress = progress
         self.logger = logger
-        self._networkAccessManager = QtNetwork.QNetworkAccessManager(parent=self)
+        self._networkAccessManager = App.ConnectionPool.createNetworkAccessManager(parent=self)
         self.file = QtCore.QFile(self.downloadInfo.getAbsoluteFileName(), self)
+        self._openFile()
+
+    def _openFile(self) -> None:
         self.file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
 
     def start(self) -> None:
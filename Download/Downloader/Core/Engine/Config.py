@@ -3,19 +3,68 @@ class Config:
     PLAYLIST_UPDATE_MAX_RETRY_COUNT = 10
     PLAYLIST_UPDATE_RETRY_INTERVAL = 3000
     PLAYLIST_UPDATE_INTERVAL = 2000
+    PLAYLIST_UPDATE_MIN_INTERVAL = 500
+    PLAYLIST_UPDATE_MAX_INTERVAL = 10000
 
-    FILE_CHUNK_SIZE = 1024
+    FILE_MERGE_BUFFER_SIZE = 4 * 1024 * 1024
+    FILE_WRITE_BUFFER_SIZE = 1024 * 1024
+    FILE_READ_BUFFER_SIZE = 1024 * 1024
+    FILE_PREALLOCATION_ENABLED = True
     FILE_REQUEST_TIMEOUT = 10000
     FILE_REQUEST_MAX_RETRY_COUNT = 3
     FILE_REQUEST_RETRY_INTERVAL = 5000
+    FILE_REQUEST_RETRY_MAX_INTERVAL = 30000
     FILE_DOWNLOAD_MANAGER_MIN_POOL_SIZE = 1
     FILE_DOWNLOAD_MANAGER_MAX_POOL_SIZE = 20
+    FILE_DOWNLOAD_MANAGER_FAIR_SCHEDULING_ENABLED = True
+    FILE_DOWNLOAD_MANAGER_PRIORITY_WEIGHTS = [1, 4, 16]
+    FILE_DOWNLOAD_MANAGER_DEADLINE_PREEMPT_TIME = 4000
+    FILE_DOWNLOAD_MANAGER_DEADLINE_MAX_OVERSHOOT = 1
+    FILE_DOWNLOAD_MANAGER_ADAPTIVE_UPDATE_INTERVAL = 3000
+    FILE_DOWNLOAD_MANAGER_ADAPTIVE_MIN_SAMPLE_COUNT = 4
+    FILE_DOWNLOAD_MANAGER_ADAPTIVE_TOLERANCE = 0.05
+    FILE_DOWNLOAD_MANAGER_ADAPTIVE_MAX_ERROR_RATE = 0.1
+    FILE_DOWNLOAD_MANAGER_ADAPTIVE_DECREASE_FACTOR = 0.5
+    FILE_DOWNLOAD_MANAGER_ADAPTIVE_HOLD_COUNT = 5
+    FILE_RANGE_DOWNLOAD_ENABLED = True
+    FILE_RANGE_MAX_CONNECTION_COUNT = 4
+    FILE_RANGE_MIN_BYTE_SIZE = 4 * 1024 * 1024
+    FILE_BANDWIDTH_LIMIT = 0
+    FILE_BANDWIDTH_DOWNLOAD_LIMIT = 0
+    FILE_BANDWIDTH_LIMIT_SCHEDULE = []
+    FILE_BANDWIDTH_MIN_READ_SIZE = 16 * 1024
+    FILE_CIRCUIT_BREAKER_ENABLED = True
+    FILE_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+    FILE_CIRCUIT_BREAKER_OPEN_INTERVAL = 5000
+    FILE_CIRCUIT_BREAKER_MAX_OPEN_INTERVAL = 60000
+    FILE_HEDGING_ENABLED = True
+    FILE_HEDGING_BUDGET = 0.05
+    FILE_HEDGING_PERCENTILE = 0.95
+    FILE_HEDGING_MIN_DELAY = 1000
+    FILE_HEDGING_MIN_SAMPLE_COUNT = 20
+    FILE_HEDGING_MAX_SAMPLE_COUNT = 200
+    FILE_HEDGING_CHECK_INTERVAL = 250
+
+    NETWORK_HTTP2_ENABLED = True
+    NETWORK_TLS_SESSION_RESUMPTION_ENABLED = True
+    NETWORK_MAX_CONNECTION_COUNT_PER_HOST = 6
+
+    SEGMENT_SPOOL_ENABLED = True
+    SEGMENT_SPOOL_MAX_BYTE_SIZE = 64 * 1024 * 1024
+    SEGMENT_SPOOL_GLOBAL_MAX_BYTE_SIZE = 256 * 1024 * 1024
+
+    SEGMENT_MUTE_PROBE_ENABLED = True
+    SEGMENT_MUTE_MAP_MIN_FAILURE_COUNT = 2
 
     STREAM_SEGMENT_TITLE_FILTER_REGEX = ["^Amazon\|.*$"]
+    STREAM_SEGMENT_PREFETCH_ENABLED = True
 
-    UPDATE_TRACK_MAX_RETRY_COUNT = 5
+    UPDATE_TRACK_MAX_WAITING_TIME = 720000
     UPDATE_TRACK_INTERVAL = 120000
+    UPDATE_TRACK_MAX_INTERVAL = 960000
+
+    SEGMENT_WRITER_MAX_QUEUE_SIZE = 8
 
-    PIPE_TIMEOUT = 3000
+    DOWNLOAD_MANIFEST_SAVE_INTERVAL = 1000
 
     CHANNEL_AUTO_UPDATE_INTERVAL = 180000
\ No newline at end of file
@@ -4,4 +4,8 @@ from Core.Config import Config as CoreConfig, _P
 class Config:
     PATH = _P(CoreConfig.DEPENDENCIES_ROOT, "ffmpeg.exe")
 
+    INPUT_BUFFER_SIZE = 1024 * 1024
+    INPUT_HIGH_WATERMARK = 32 * 1024 * 1024
+    INPUT_LOW_WATERMARK = 8 * 1024 * 1024
+
     KILL_TIMEOUT = 10000
\ No newline at end of file
@@ -5,6 +5,7 @@ from Services.Logging.Logger import Logger
 
 from PyQt6 import QtCore
 
+import collections
 import enum
 
 
@@ -22,6 +23,8 @@ class FFmpeg(QtCore.QObject):
 
     started = QtCore.pyqtSignal()
     finished = QtCore.pyqtSignal()
+    inputBlocked = QtCore.pyqtSignal()
+    inputReleased = QtCore.pyqtSignal()
 
     def __init__(self, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
@@ -32,6 +35,10 @@ class FFmpeg(QtCore.QObject):
         self._process.finished.connect(self._onProcessFinish)
         self._process.readyReadStandardError.connect(self._readStandardError)
         self._process.readyReadStandardOutput.connect(self._readStandardOutput)
+        self._process.bytesWritten.connect(self._drainInput)
+        self._inputQueue: collections.deque[QtCore.QByteArray] = collections.deque()
+        self._inputQueueByteSize = 0
+        self._inputBlocked = False
         self._error: Exceptions.ProcessError | None = None
         self._closeRequested = False
 
@@ -54,19 +61,32 @@ class FFmpeg(QtCore.QObject):
             )
         )
 
-    def write(self, data: bytes) -> int:
-        return self._process.write(data)
+    def write(self, data: QtCore.QByteArray) -> bool:
+        if self._closeRequested or not self.isRunning():
+            return False
+        self._inputQueue.append(QtCore.QByteArray(data))
+        self._inputQueueByteSize += data.size()
+        return self._drainInput()
 
-    def waitForBytesWritten(self, timeout: int) -> bool:
-        return self._process.waitForBytesWritten(timeout)
+    def getPendingInputByteSize(self) -> int:
+        return self._inputQueueByteSize + self._process.bytesToWrite()
+
+    def isInputBlocked(self) -> bool:
+        return self._inputBlocked
 
     def closeStream(self) -> None:
         self._closeRequested = True
         self.logger.info("Closing subprocess write channel.")
+        while len(self._inputQueue) != 0:
+            if self._process.write(self._inputQueue.popleft()) == -1:
+                self.logger.warning("Unable to write data to subprocess.")
+                self._clearInput()
+        self._inputQueueByteSize = 0
         self._process.closeWriteChannel()
 
     def terminate(self) -> None:
         self.logger.warning("Terminating subprocess.")
+        self._clearInput()
         if not self._closeRequested:
             self.closeStream()
         self._process.terminate()
@@ -83,6 +103,28 @@ class FFmpeg(QtCore.QObject):
     def getError(self) -> Exceptions.ProcessError | None:
         return self._error
 
+    def _drainInput(self) -> bool:
+        while len(self._inputQueue) != 0 and self._process.bytesToWrite() < Config.INPUT_BUFFER_SIZE:
+            data = self._inputQueue.popleft()
+            self._inputQueueByteSize -= data.size()
+            if self._process.write(data) == -1:
+                self.logger.warning("Unable to write data to subprocess.")
+                self._clearInput()
+                return False
+        pendingByteSize = self.getPendingInputByteSize()
+        if self._inputBlocked:
+            if pendingByteSize <= Config.INPUT_LOW_WATERMARK:
+                self._inputBlocked = False
+                self.inputReleased.emit()
+        elif pendingByteSize >= Config.INPUT_HIGH_WATERMARK:
+            self._inputBlocked = True
+            self.inputBlocked.emit()
+        return True
+
+    def _clearInput(self) -> None:
+        self._inputQueue.clear()
+        self._inputQueueByteSize = 0
+
     def _onProcessError(self, error: QtCore.QProcess.ProcessError) -> None:
         self.logger.error(f"Subprocess error occurred.\n{error.name}: {error.value}")
         if error == QtCore.QProcess.ProcessError.FailedToStart:
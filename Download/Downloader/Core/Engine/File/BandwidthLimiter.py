@@ -0,0 +1,122 @@
+from PyQt6 import QtCore
+
+import threading
+import time
+import typing
+import weakref
+
+
+class TokenBucket:
+    def __init__(self, rate: int = 0, burstSeconds: float = 1.0):
+        self._rate = rate
+        self._burstSeconds = burstSeconds
+        self._tokens = 0.0
+        self._updatedAt = time.monotonic()
+
+    def setRate(self, rate: int) -> None:
+        self._refill()
+        self._rate = rate
+        self._tokens = min(self._tokens, self._getCapacity())
+
+    def getRate(self) -> int:
+        return self._rate
+
+    def getAvailable(self) -> int | None:
+        if self._rate <= 0:
+            return None
+        self._refill()
+        return int(self._tokens)
+
+    def consume(self, byteSize: int) -> None:
+        if self._rate > 0:
+            self._tokens -= byteSize
+
+    def getWaitTime(self, byteSize: int) -> int:
+        if self._rate <= 0:
+            return 0
+        self._refill()
+        return max(int((byteSize - self._tokens) * 1000 / self._rate), 0)
+
+    def _getCapacity(self) -> float:
+        return self._rate * self._burstSeconds
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updatedAt) * self._rate, self._getCapacity())
+        self._updatedAt = now
+
+
+class BandwidthLimiter:
+    def __init__(self, rate: int = 0, downloadRate: int = 0, schedule: typing.Iterable[tuple[str, str, int]] = ()):
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._downloadRate = downloadRate
+        self._schedule: list[tuple[QtCore.QTime, QtCore.QTime, int]] = []
+        self._bucket = TokenBucket(rate)
+        self._downloadBuckets: weakref.WeakKeyDictionary[QtCore.QObject, TokenBucket] = weakref.WeakKeyDictionary()
+        self.setSchedule(schedule)
+
+    def setRate(self, rate: int) -> None:
+        with self._lock:
+            self._rate = rate
+
+    def getRate(self) -> int:
+        return self._rate
+
+    def setDownloadRate(self, downloadRate: int) -> None:
+        with self._lock:
+            self._downloadRate = downloadRate
+
+    def getDownloadRate(self) -> int:
+        return self._downloadRate
+
+    def setSchedule(self, schedule: typing.Iterable[tuple[str, str, int]]) -> None:
+        with self._lock:
+            self._schedule = [(QtCore.QTime.fromString(start, "HH:mm"), QtCore.QTime.fromString(end, "HH:mm"), rate) for start, end, rate in schedule]
+
+    def getSchedule(self) -> list[tuple[str, str, int]]:
+        return [(start.toString("HH:mm"), end.toString("HH:mm"), rate) for start, end, rate in self._schedule]
+
+    def getCurrentRate(self) -> int:
+        currentTime = QtCore.QTime.currentTime()
+        for start, end, rate in self._schedule:
+            if (start <= currentTime < end) if start <= end else (currentTime >= start or currentTime < end):
+                return rate
+        return self._rate
+
+    def isLimited(self) -> bool:
+        return self.getCurrentRate() > 0 or self._downloadRate > 0
+
+    def acquire(self, group: QtCore.QObject | None, byteSize: int) -> int:
+        with self._lock:
+            buckets = self._getBuckets(group)
+            for bucket in buckets:
+                available = bucket.getAvailable()
+                if available != None:
+                    byteSize = min(byteSize, max(available, 0))
+            for bucket in buckets:
+                bucket.consume(byteSize)
+            return byteSize
+
+    def consume(self, group: QtCore.QObject | None, byteSize: int) -> None:
+        with self._lock:
+            for bucket in self._getBuckets(group):
+                bucket.consume(byteSize)
+
+    def getWaitTime(self, group: QtCore.QObject | None, byteSize: int) -> int:
+        with self._lock:
+            return max(bucket.getWaitTime(byteSize) for bucket in self._getBuckets(group))
+
+    def _getBuckets(self, group: QtCore.QObject | None) -> list[TokenBucket]:
+        rate = self.getCurrentRate()
+        if self._bucket.getRate() != rate:
+            self._bucket.setRate(rate)
+        if group == None or self._downloadRate <= 0:
+            return [self._bucket]
+        bucket = self._downloadBuckets.get(group)
+        if bucket == None:
+            bucket = TokenBucket(self._downloadRate)
+            self._downloadBuckets[group] = bucket
+        elif bucket.getRate() != self._downloadRate:
+            bucket.setRate(self._downloadRate)
+        return [self._bucket, bucket]
\ No newline at end of file
@@ -0,0 +1,79 @@
+from ..Config import Config
+
+from PyQt6 import QtCore, QtNetwork
+
+import enum
+import random
+
+
+class CircuitBreaker:
+    class States(enum.Enum):
+        CLOSED = "closed"
+        OPEN = "open"
+        HALF_OPEN = "half_open"
+
+    FAILURE_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.ConnectionRefusedError,
+        QtNetwork.QNetworkReply.NetworkError.RemoteHostClosedError,
+        QtNetwork.QNetworkReply.NetworkError.TimeoutError,
+        QtNetwork.QNetworkReply.NetworkError.OperationCanceledError,
+        QtNetwork.QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+        QtNetwork.QNetworkReply.NetworkError.NetworkSessionFailedError,
+        QtNetwork.QNetworkReply.NetworkError.InternalServerError,
+        QtNetwork.QNetworkReply.NetworkError.ServiceUnavailableError,
+        QtNetwork.QNetworkReply.NetworkError.UnknownServerError
+    )
+
+    def __init__(self):
+        self._state = self.States.CLOSED
+        self._failureCount = 0
+        self._openCount = 0
+        self._openUntil = 0
+        self._trialStarted = False
+
+    def getState(self) -> States:
+        return self._state
+
+    def getRetryTime(self) -> int | None:
+        return self._openUntil if self._state == self.States.OPEN else None
+
+    def canRequest(self) -> bool:
+        if self._state == self.States.OPEN and QtCore.QDateTime.currentMSecsSinceEpoch() >= self._openUntil:
+            self._state = self.States.HALF_OPEN
+            self._trialStarted = False
+        if self._state == self.States.OPEN:
+            return False
+        elif self._state == self.States.HALF_OPEN:
+            return not self._trialStarted
+        else:
+            return True
+
+    def requestStarted(self) -> None:
+        if self._state == self.States.HALF_OPEN:
+            self._trialStarted = True
+
+    def recordSuccess(self) -> None:
+        self._state = self.States.CLOSED
+        self._failureCount = 0
+        self._openCount = 0
+
+    def recordFailure(self, error: QtNetwork.QNetworkReply.NetworkError) -> None:
+        if self._state == self.States.OPEN:
+            return
+        elif error not in self.FAILURE_ERRORS:
+            self.recordRelease()
+            return
+        self._failureCount += 1
+        if self._state == self.States.HALF_OPEN or self._failureCount >= Config.FILE_CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            self._open()
+
+    def recordRelease(self) -> None:
+        if self._state == self.States.HALF_OPEN:
+            self._trialStarted = False
+
+    def _open(self) -> None:
+        interval = min(Config.FILE_CIRCUIT_BREAKER_OPEN_INTERVAL * 2 ** self._openCount, Config.FILE_CIRCUIT_BREAKER_MAX_OPEN_INTERVAL)
+        self._state = self.States.OPEN
+        self._openCount += 1
+        self._openUntil = QtCore.QDateTime.currentMSecsSinceEpoch() + random.randint(interval // 2, interval)
+        self._trialStarted = False
\ No newline at end of file
@@ -0,0 +1,93 @@
+from ..Config import Config
+
+from PyQt6 import QtCore, QtNetwork
+
+import threading
+import typing
+
+
+class ConnectionPool(QtCore.QObject):
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._lock = threading.Lock()
+        self._sessionTickets: dict[tuple[str, int], QtCore.QByteArray] = {}
+        self._activeRequests: dict[str, dict[QtNetwork.QNetworkAccessManager, int]] = {}
+        self._multiplexedHosts: set[str] = set()
+
+    def createNetworkAccessManager(self, parent: QtCore.QObject | None = None) -> QtNetwork.QNetworkAccessManager:
+        return PooledNetworkAccessManager(self, parent=parent)
+
+    def prepareRequest(self, request: QtNetwork.QNetworkRequest) -> None:
+        request.setAttribute(QtNetwork.QNetworkRequest.Attribute.Http2AllowedAttribute, Config.NETWORK_HTTP2_ENABLED)
+        if request.url().scheme() == "https" and Config.NETWORK_TLS_SESSION_RESUMPTION_ENABLED:
+            sslConfiguration = request.sslConfiguration()
+            sslConfiguration.setSslOption(QtNetwork.QSsl.SslOption.SslOptionDisableSessionPersistence, False)
+            with self._lock:
+                sessionTicket = self._sessionTickets.get(self._getSessionKey(request.url()))
+            if sessionTicket != None:
+                sslConfiguration.setSessionTicket(sessionTicket)
+            request.setSslConfiguration(sslConfiguration)
+
+    def registerReply(self, networkAccessManager: QtNetwork.QNetworkAccessManager, reply: QtNetwork.QNetworkReply) -> None:
+        host = reply.url().host()
+        with self._lock:
+            requests = self._activeRequests.setdefault(host, {})
+            requests[networkAccessManager] = requests.get(networkAccessManager, 0) + 1
+        reply.encrypted.connect(lambda: self._saveSessionTicket(reply))
+        reply.finished.connect(lambda: self._releaseReply(networkAccessManager, reply, host))
+
+    def _saveSessionTicket(self, reply: QtNetwork.QNetworkReply) -> None:
+        sslConfiguration = reply.sslConfiguration()
+        sessionTicket = sslConfiguration.sessionTicket()
+        if sslConfiguration.sessionProtocol() == QtNetwork.QSsl.SslProtocol.TlsV1_3 and not sessionTicket.isEmpty():
+            with self._lock:
+                self._sessionTickets[self._getSessionKey(reply.url())] = sessionTicket
+
+    def _releaseReply(self, networkAccessManager: QtNetwork.QNetworkAccessManager, reply: QtNetwork.QNetworkReply, host: str) -> None:
+        if reply.url().scheme() == "https":
+            self._saveSessionTicket(reply)
+        multiplexed = reply.attribute(QtNetwork.QNetworkRequest.Attribute.Http2WasUsedAttribute) == True
+        with self._lock:
+            if multiplexed:
+                self._multiplexedHosts.add(host)
+            requests = self._activeRequests[host]
+            requests[networkAccessManager] -= 1
+            if requests[networkAccessManager] == 0:
+                del requests[networkAccessManager]
+                if len(requests) == 0:
+                    del self._activeRequests[host]
+
+    def _getSessionKey(self, url: QtCore.QUrl) -> tuple[str, int]:
+        return url.host(), url.port(443)
+
+    def isMultiplexed(self, host: str) -> bool:
+        return host in self._multiplexedHosts
+
+    def getEstimatedConnectionCount(self, host: str) -> int:
+        return self.getEstimatedConnectionCounts().get(host, 0)
+
+    def getEstimatedConnectionCounts(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                host: sum(1 if host in self._multiplexedHosts else min(count, Config.NETWORK_MAX_CONNECTION_COUNT_PER_HOST) for count in requests.values())
+                for host, requests in self._activeRequests.items()
+            }
+
+
+class PooledNetworkAccessManager(QtNetwork.QNetworkAccessManager):
+    def __init__(self, connectionPool: ConnectionPool, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._connectionPool = connectionPool
+
+    def get(self, request: QtNetwork.QNetworkRequest) -> typing.Any:
+        self._connectionPool.prepareRequest(request)
+        return super().get(request)
+
+    def head(self, request: QtNetwork.QNetworkRequest) -> typing.Any:
+        self._connectionPool.prepareRequest(request)
+        return super().head(request)
+
+    def createRequest(self, operation: QtNetwork.QNetworkAccessManager.Operation, request: QtNetwork.QNetworkRequest, outgoingData: QtCore.QIODevice | None = None) -> QtNetwork.QNetworkReply:
+        reply = super().createRequest(operation, request, outgoingData)
+        self._connectionPool.registerReply(self, reply)
+        return reply
\ No newline at end of file
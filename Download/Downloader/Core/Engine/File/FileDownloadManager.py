@@ -1,22 +1,52 @@
+from ..Config import Config
 from .FileDownloader import FileDownloader
+from .BandwidthLimiter import BandwidthLimiter
+from .PoolSizeController import PoolSizeController
+from .CircuitBreaker import CircuitBreaker
 
-from Services.PriorityQueue import PriorityQueue
+from Core.GlobalExceptions import Exceptions
+from Services.FairQueue import FairQueue
 
 from PyQt6 import QtCore
 
+import collections
+import time
 import typing
 
 
 class FileDownloadManager(QtCore.QObject):
+    poolSizeChanged = QtCore.pyqtSignal(int)
     _startRequested = QtCore.pyqtSignal(object)
     _cancelRequested = QtCore.pyqtSignal(object)
 
     def __init__(self, poolSize: int = 20, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self._poolSize = poolSize
-        self._queue = PriorityQueue()
+        self._queue = FairQueue()
         self._pool = []
         self._tempPool = []
+        self._activeDownloads: dict[FileDownloader, tuple[float, int]] = {}
+        self._saturated = False
+        self._adaptivePoolSizeEnabled = False
+        self._poolSizeController = PoolSizeController(Config.FILE_DOWNLOAD_MANAGER_MIN_POOL_SIZE, Config.FILE_DOWNLOAD_MANAGER_MAX_POOL_SIZE, self._poolSize)
+        self._poolSizeUpdatedAt = time.monotonic()
+        self._poolSizeUpdateTimer = QtCore.QTimer(parent=self)
+        self._poolSizeUpdateTimer.setInterval(Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_UPDATE_INTERVAL)
+        self._poolSizeUpdateTimer.timeout.connect(self._updatePoolSize)
+        self._circuitBreakers: dict[str, CircuitBreaker] = {}
+        self._heldDownloads: dict[str, dict[FileDownloader, None]] = {}
+        self._heldHosts: dict[FileDownloader, str] = {}
+        self._circuitBreakerTimer = QtCore.QTimer(parent=self)
+        self._circuitBreakerTimer.setSingleShot(True)
+        self._circuitBreakerTimer.timeout.connect(self._releaseHeldDownloads)
+        self._completionTimes: dict[str, collections.deque[float]] = {}
+        self._hedgeableRequestCount = 0
+        self._hedgeCount = 0
+        self._hedgedDownloads: set[FileDownloader] = set()
+        self._hedgeTimer = QtCore.QTimer(parent=self)
+        self._hedgeTimer.setInterval(Config.FILE_HEDGING_CHECK_INTERVAL)
+        self._hedgeTimer.timeout.connect(self._hedgeDownloads)
+        self._bandwidthLimiter = BandwidthLimiter(Config.FILE_BANDWIDTH_LIMIT, Config.FILE_BANDWIDTH_DOWNLOAD_LIMIT, Config.FILE_BANDWIDTH_LIMIT_SCHEDULE)
         self._startRequested.connect(self._startDownloadHandler)
         self._cancelRequested.connect(self._cancelDownloadHandler)
 
@@ -28,9 +58,18 @@ class FileDownloadManager(QtCore.QObject):
 
     def _startDownloadHandler(self, fileDownloaders: typing.Iterable[FileDownloader]) -> None:
         for fileDownloader in fileDownloaders:
-            self._queue.push(fileDownloader, priority=fileDownloader.getPriority())
+            self._pushDownload(fileDownloader)
         self._updateState()
 
+    def _pushDownload(self, fileDownloader: FileDownloader) -> None:
+        self._queue.push(
+            fileDownloader,
+            priority=fileDownloader.getPriority(),
+            group=fileDownloader.getGroup() if Config.FILE_DOWNLOAD_MANAGER_FAIR_SCHEDULING_ENABLED else None,
+            weight=fileDownloader.getWeight(),
+            deadline=fileDownloader.getDeadline()
+        )
+
     def cancelDownload(self, fileDownloader: FileDownloader) -> None:
         self._cancelRequested.emit([fileDownloader])
 
@@ -40,34 +79,185 @@ class FileDownloadManager(QtCore.QObject):
     def _cancelDownloadHandler(self, fileDownloaders: typing.Iterable[FileDownloader]) -> None:
         self._queue.removeItems([fileDownloader for fileDownloader in fileDownloaders if fileDownloader in self._queue])
         for fileDownloader in fileDownloaders:
+            if fileDownloader in self._heldHosts:
+                self._heldDownloads[self._heldHosts.pop(fileDownloader)].pop(fileDownloader)
             fileDownloader.abort()
 
     def setPoolSize(self, poolSize: int) -> None:
         self._poolSize = poolSize
+        if not self._adaptivePoolSizeEnabled:
+            self.poolSizeChanged.emit(self.getEffectivePoolSize())
         self._updateState()
 
     def getPoolSize(self) -> int:
         return self._poolSize
 
+    def setAdaptivePoolSizeEnabled(self, enabled: bool) -> None:
+        self._adaptivePoolSizeEnabled = enabled
+        if self._adaptivePoolSizeEnabled:
+            self._poolSizeController.reset(self._poolSize)
+            self._poolSizeUpdatedAt = time.monotonic()
+            self._saturated = False
+            self._poolSizeUpdateTimer.start()
+        else:
+            self._poolSizeUpdateTimer.stop()
+        self.poolSizeChanged.emit(self.getEffectivePoolSize())
+        self._updateState()
+
+    def isAdaptivePoolSizeEnabled(self) -> bool:
+        return self._adaptivePoolSizeEnabled
+
+    def getEffectivePoolSize(self) -> int:
+        return self._poolSizeController.getPoolSize() if self._adaptivePoolSizeEnabled else self._poolSize
+
+    def _updatePoolSize(self) -> None:
+        now = time.monotonic()
+        poolSize = self._poolSizeController.getPoolSize()
+        if self._poolSizeController.update(now - self._poolSizeUpdatedAt, self._saturated) != poolSize:
+            self.poolSizeChanged.emit(self._poolSizeController.getPoolSize())
+        self._poolSizeUpdatedAt = now
+        self._saturated = len(self._queue) != 0
+        self._updateState()
+
+    def getBandwidthLimiter(self) -> BandwidthLimiter:
+        return self._bandwidthLimiter
+
     def _updateState(self) -> None:
-        while len(self._pool) < self._poolSize and len(self._queue) != 0:
+        poolSize = self.getEffectivePoolSize()
+        while len(self._queue) != 0 and (len(self._pool) < poolSize or (len(self._pool) < poolSize + Config.FILE_DOWNLOAD_MANAGER_DEADLINE_MAX_OVERSHOOT and self._isDeadlineUrgent())):
             downloader = self._queue.pop()
+            if Config.FILE_CIRCUIT_BREAKER_ENABLED:
+                circuitBreaker = self._getCircuitBreaker(downloader.getHost())
+                if not circuitBreaker.canRequest():
+                    self._holdDownload(downloader)
+                    continue
+                circuitBreaker.requestStarted()
             downloader.finished.connect(self._removeFromPool)
             downloader._retryRequired.connect(self._downloadRetryRequired)
             downloader._retryRequested.connect(self._downloadRetryRequested)
+            downloader.setBandwidthLimiter(self._bandwidthLimiter)
             downloader.start()
             self._pool.append(downloader)
+            self._activeDownloads[downloader] = (time.monotonic(), downloader.bytesReceived)
+            if downloader.isHedgeable():
+                self._hedgeableRequestCount += 1
+        if len(self._queue) != 0:
+            self._saturated = True
+        if Config.FILE_HEDGING_ENABLED and len(self._activeDownloads) != 0 and not self._hedgeTimer.isActive():
+            self._hedgeTimer.start()
+        self._updateCircuitBreakerTimer()
+
+    def _getCircuitBreaker(self, host: str) -> CircuitBreaker:
+        if host not in self._circuitBreakers:
+            self._circuitBreakers[host] = CircuitBreaker()
+        return self._circuitBreakers[host]
+
+    def _holdDownload(self, downloader: FileDownloader) -> None:
+        host = downloader.getHost()
+        self._heldHosts[downloader] = host
+        self._heldDownloads.setdefault(host, {})[downloader] = None
+
+    def _releaseHeldDownloads(self) -> None:
+        released = False
+        for host, downloaders in self._heldDownloads.items():
+            if len(downloaders) != 0 and self._circuitBreakers[host].canRequest():
+                for downloader in downloaders:
+                    self._heldHosts.pop(downloader)
+                    self._pushDownload(downloader)
+                downloaders.clear()
+                released = True
+        if released:
+            self._updateState()
+        else:
+            self._updateCircuitBreakerTimer()
+
+    def _updateCircuitBreakerTimer(self) -> None:
+        retryTimes = [self._circuitBreakers[host].getRetryTime() for host, downloaders in self._heldDownloads.items() if len(downloaders) != 0]
+        retryTimes = [retryTime for retryTime in retryTimes if retryTime != None]
+        if len(retryTimes) == 0:
+            self._circuitBreakerTimer.stop()
+        else:
+            self._circuitBreakerTimer.start(max(min(retryTimes) - QtCore.QDateTime.currentMSecsSinceEpoch(), 0))
+
+    def getHedgeCount(self) -> int:
+        return self._hedgeCount
+
+    def getHedgeBudget(self) -> int:
+        return int(self._hedgeableRequestCount * Config.FILE_HEDGING_BUDGET)
+
+    def _hedgeDownloads(self) -> None:
+        if len(self._activeDownloads) == 0:
+            self._hedgeTimer.stop()
+            return
+        if self._bandwidthLimiter.isLimited():
+            return
+        now = time.monotonic()
+        thresholds = {}
+        for downloader, (startedAt, bytesReceived) in self._activeDownloads.items():
+            if self._hedgeCount + 1 > self._hedgeableRequestCount * Config.FILE_HEDGING_BUDGET:
+                return
+            if downloader in self._hedgedDownloads or not downloader.canHedge():
+                continue
+            host = downloader.getHost()
+            if host not in thresholds:
+                thresholds[host] = self._getHedgeThreshold(host)
+            if thresholds[host] != None and now - startedAt > thresholds[host]:
+                self._hedgedDownloads.add(downloader)
+                self._hedgeCount += 1
+                downloader.hedge()
+
+    def _getHedgeThreshold(self, host: str) -> float | None:
+        completionTimes = self._completionTimes.get(host, ())
+        if len(completionTimes) < Config.FILE_HEDGING_MIN_SAMPLE_COUNT:
+            return None
+        if host in self._circuitBreakers and self._circuitBreakers[host].getState() != CircuitBreaker.States.CLOSED:
+            return None
+        return max(sorted(completionTimes)[int((len(completionTimes) - 1) * Config.FILE_HEDGING_PERCENTILE)], Config.FILE_HEDGING_MIN_DELAY / 1000)
+
+    def _isDeadlineUrgent(self) -> bool:
+        deadline = self._queue.getEarliestDeadline()
+        return deadline != None and deadline - QtCore.QDateTime.currentMSecsSinceEpoch() < Config.FILE_DOWNLOAD_MANAGER_DEADLINE_PREEMPT_TIME
 
     def _removeFromPool(self, downloader: FileDownloader) -> None:
         downloader.finished.disconnect(self._removeFromPool)
         downloader._retryRequired.disconnect(self._downloadRetryRequired)
         downloader._retryRequested.disconnect(self._downloadRetryRequested)
         self._pool.remove(downloader)
+        self._recordDownload(downloader, downloader.getError())
         self._updateState()
 
-    def _downloadRetryRequired(self, downloader: FileDownloader) -> None:
+    def _recordDownload(self, downloader: FileDownloader, exception: Exception | None) -> None:
+        startedAt, bytesReceived = self._activeDownloads.pop(downloader)
+        self._hedgedDownloads.discard(downloader)
+        if exception == None and downloader.isHedgeable():
+            self._completionTimes.setdefault(downloader.getHost(), collections.deque(maxlen=Config.FILE_HEDGING_MAX_SAMPLE_COUNT)).append(time.monotonic() - startedAt)
+        if Config.FILE_CIRCUIT_BREAKER_ENABLED:
+            self._recordHostResult(downloader.getHost(), exception)
+        if not self._adaptivePoolSizeEnabled:
+            return
+        if exception == None:
+            self._poolSizeController.addRequest(downloader.bytesReceived - bytesReceived, time.monotonic() - startedAt)
+        elif isinstance(exception, Exceptions.NetworkError):
+            self._poolSizeController.addError(exception.reasonCode)
+
+    def _recordHostResult(self, host: str, exception: Exception | None) -> None:
+        circuitBreaker = self._getCircuitBreaker(host)
+        state = circuitBreaker.getState()
+        if exception == None:
+            circuitBreaker.recordSuccess()
+        elif isinstance(exception, Exceptions.NetworkError):
+            circuitBreaker.recordFailure(exception.reasonCode)
+        else:
+            circuitBreaker.recordRelease()
+        if circuitBreaker.getState() != CircuitBreaker.States.OPEN and len(self._heldDownloads.get(host, {})) != 0:
+            self._releaseHeldDownloads()
+        elif state != circuitBreaker.getState():
+            self._updateCircuitBreakerTimer()
+
+    def _downloadRetryRequired(self, downloader: FileDownloader, exception: Exception) -> None:
         downloader.finished.disconnect(self._removeFromPool)
         self._pool.remove(downloader)
+        self._recordDownload(downloader, exception)
         self._updateState()
         self._tempPool.append(downloader)
         downloader.finished.connect(self._removeFromTempPool)
@@ -80,5 +270,5 @@ class FileDownloadManager(QtCore.QObject):
 
     def _downloadRetryRequested(self, downloader: FileDownloader) -> None:
         self._removeFromTempPool(downloader)
-        self._queue.push(downloader, priority=downloader.getPriority())
+        self._pushDownload(downloader)
         self._updateState()
\ No newline at end of file
@@ -1,9 +1,13 @@
 from ..Config import Config
+from .BandwidthLimiter import BandwidthLimiter
 
 from Core.GlobalExceptions import Exceptions
 
 from PyQt6 import QtCore, QtNetwork
 
+import os
+import random
+
 
 class FileDownloader(QtCore.QObject):
     progressChanged = QtCore.pyqtSignal(object, object)
@@ -11,14 +15,16 @@ class FileDownloader(QtCore.QObject):
     finished = QtCore.pyqtSignal(object)
     _startRequested = QtCore.pyqtSignal()
     _abortRequested = QtCore.pyqtSignal(object)
-    _retryRequired = QtCore.pyqtSignal(object)
+    _retryRequired = QtCore.pyqtSignal(object, object)
     _retryRequested = QtCore.pyqtSignal(object)
+    _hedgeRequested = QtCore.pyqtSignal()
 
     def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, url: QtCore.QUrl, filePath: str, priority: int = 0, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self.url = url
         self.filePath = filePath
         self._priority = priority
+        self._deadline: int | None = None
         self.file = QtCore.QFile(self.filePath, self)
         self.bytesReceived = 0
         self.bytesTotal = 0
@@ -26,34 +32,168 @@ class FileDownloader(QtCore.QObject):
         self._request = QtNetwork.QNetworkRequest(self.url)
         self._request.setTransferTimeout(Config.FILE_REQUEST_TIMEOUT)
         self._reply: QtNetwork.QNetworkReply | None = None
+        self._hedgeReply: QtNetwork.QNetworkReply | None = None
+        self._hedged = False
+        self._hedgeWon = False
         self._error: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError | None = None
         self._retryScheduled: bool = False
+        self._rangeSupported = False
+        self._validator: QtCore.QByteArray | None = None
+        self._outputByteSize = 0
+        self._resumeByteSize = 0
+        self._writeBuffer = QtCore.QByteArray()
+        self._preallocated = False
         self._retryCount = 0
         self._finished = False
+        self._bandwidthLimiter: BandwidthLimiter | None = None
+        self._readTimer = QtCore.QTimer(parent=self)
+        self._readTimer.setSingleShot(True)
+        self._readTimer.timeout.connect(self._onReadyRead)
         self._retryTimer = QtCore.QTimer(parent=self)
         self._retryTimer.setSingleShot(True)
         self._retryTimer.timeout.connect(self._retryTimerTimeout)
         self._startRequested.connect(self._startHandler)
         self._abortRequested.connect(self._abortHandler)
+        self._hedgeRequested.connect(self._hedgeHandler)
+
+    def getHost(self) -> str:
+        return self._request.url().host()
 
     def getPriority(self) -> int:
         return self._priority * (Config.FILE_REQUEST_MAX_RETRY_COUNT + 1) + self._retryCount
 
+    def setDeadline(self, deadline: int | None) -> None:
+        self._deadline = deadline
+
+    def getDeadline(self) -> int | None:
+        return self._deadline
+
+    def getGroup(self) -> QtCore.QObject | None:
+        return self.parent()
+
+    def getWeight(self) -> int:
+        return Config.FILE_DOWNLOAD_MANAGER_PRIORITY_WEIGHTS[min(max(self._priority, 0), len(Config.FILE_DOWNLOAD_MANAGER_PRIORITY_WEIGHTS) - 1)]
+
+    def setBandwidthLimiter(self, bandwidthLimiter: BandwidthLimiter | None) -> None:
+        self._bandwidthLimiter = bandwidthLimiter
+
     def start(self) -> None:
         self._startRequested.emit()
 
     def _startHandler(self) -> None:
         if self._reply == None:
-            self._setDownloadProgress(0, 0)
-            if not self.file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly):
+            self._resumeByteSize = self._outputByteSize if self._rangeSupported else 0
+            self._outputByteSize = self._resumeByteSize
+            self._setRequestRange()
+            self._setDownloadProgress(self._resumeByteSize, 0)
+            if not self._openOutput(append=self._resumeByteSize != 0):
                 self._raiseException(Exceptions.FileSystemError(self.file))
                 return
             self._reply = self._networkAccessManager.get(self._request)
+            self._setReadBufferSize()
+            self._reply.metaDataChanged.connect(self._setReadBufferSize)
+            self._reply.metaDataChanged.connect(self._onMetaDataChanged)
             self._reply.readyRead.connect(self._onReadyRead)
-            self._reply.downloadProgress.connect(self._setDownloadProgress)
+            self._reply.downloadProgress.connect(self._onDownloadProgress)
             self._reply.errorOccurred.connect(self._onNetworkError)
             self._reply.finished.connect(self._onFinished)
 
+    def _setReadBufferSize(self) -> None:
+        if self._reply != None:
+            self._reply.setReadBufferSize(Config.FILE_READ_BUFFER_SIZE)
+
+    def _setRequestRange(self) -> None:
+        if self._resumeByteSize == 0:
+            self._request.setRawHeader(b"Range", QtCore.QByteArray())
+            self._request.setRawHeader(b"If-Range", QtCore.QByteArray())
+        else:
+            self._request.setRawHeader(b"Range", f"bytes={self._resumeByteSize}-".encode())
+            self._request.setRawHeader(b"If-Range", QtCore.QByteArray() if self._validator == None else self._validator)
+
+    def isHedgeable(self) -> bool:
+        return False
+
+    def isHedged(self) -> bool:
+        return self._hedged
+
+    def isHedgeWon(self) -> bool:
+        return self._hedgeWon
+
+    def canHedge(self) -> bool:
+        return self.isHedgeable() and self._reply != None and self._hedgeReply == None and self._resumeByteSize == 0
+
+    def hedge(self) -> None:
+        self._hedgeRequested.emit()
+
+    def _hedgeHandler(self) -> None:
+        if not self.canHedge():
+            return
+        request = QtNetwork.QNetworkRequest(self._request.url())
+        request.setTransferTimeout(Config.FILE_REQUEST_TIMEOUT)
+        self._hedged = True
+        self._hedgeReply = self._networkAccessManager.get(request)
+        self._hedgeReply.setReadBufferSize(Config.FILE_READ_BUFFER_SIZE)
+        self._hedgeReply.metaDataChanged.connect(self._onHedgeMetaDataChanged)
+        self._hedgeReply.finished.connect(self._onHedgeFinished)
+
+    def _onHedgeMetaDataChanged(self) -> None:
+        if self._hedgeReply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) != 200:
+            self._cancelHedge()
+        elif self._outputByteSize == 0:
+            self._adoptHedge()
+
+    def _onHedgeFinished(self) -> None:
+        if self._hedgeReply.error() == QtNetwork.QNetworkReply.NetworkError.NoError and self._hedgeReply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 200:
+            self._adoptHedge()
+            if self._error == None:
+                self._onFinished()
+        else:
+            self._cancelHedge()
+
+    def _adoptHedge(self) -> None:
+        reply = self._hedgeReply
+        self._hedgeReply = None
+        reply.metaDataChanged.disconnect(self._onHedgeMetaDataChanged)
+        reply.finished.disconnect(self._onHedgeFinished)
+        self._readTimer.stop()
+        self._abandonReply()
+        self._hedgeWon = True
+        self._outputByteSize = 0
+        self._reply = reply
+        self._setReadBufferSize()
+        self._reply.metaDataChanged.connect(self._setReadBufferSize)
+        self._reply.metaDataChanged.connect(self._onMetaDataChanged)
+        self._reply.readyRead.connect(self._onReadyRead)
+        self._reply.downloadProgress.connect(self._onDownloadProgress)
+        self._reply.errorOccurred.connect(self._onNetworkError)
+        self._reply.finished.connect(self._onFinished)
+        self._setDownloadProgress(0, 0)
+        if not self._resetOutput():
+            self._raiseException(Exceptions.FileSystemError(self.file))
+            return
+        self._onMetaDataChanged()
+        if self._error == None and self._reply.bytesAvailable() != 0:
+            self._onReadyRead()
+
+    def _cancelHedge(self) -> None:
+        if self._hedgeReply != None:
+            reply = self._hedgeReply
+            self._hedgeReply = None
+            reply.metaDataChanged.disconnect(self._onHedgeMetaDataChanged)
+            reply.finished.disconnect(self._onHedgeFinished)
+            reply.abort()
+
+    def _abandonReply(self) -> None:
+        reply = self._reply
+        self._reply = None
+        reply.metaDataChanged.disconnect(self._setReadBufferSize)
+        reply.metaDataChanged.disconnect(self._onMetaDataChanged)
+        reply.readyRead.disconnect(self._onReadyRead)
+        reply.downloadProgress.disconnect(self._onDownloadProgress)
+        reply.errorOccurred.disconnect(self._onNetworkError)
+        reply.finished.disconnect(self._onFinished)
+        reply.abort()
+
     def abort(self, reason: str | None = None) -> None:
         self._abortRequested.emit(reason)
 
@@ -68,22 +208,127 @@ class FileDownloader(QtCore.QObject):
         self.bytesTotal = bytesTotal
         self.progressChanged.emit(self.bytesReceived, self.bytesTotal)
 
+    def _onDownloadProgress(self, bytesReceived: int, bytesTotal: int) -> None:
+        self._setDownloadProgress(self._resumeByteSize + bytesReceived, bytesTotal if bytesTotal <= 0 else self._resumeByteSize + bytesTotal)
+
+    def _onMetaDataChanged(self) -> None:
+        statusCode = self._reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if statusCode == 200:
+            self._rangeSupported = self._reply.rawHeader(b"Accept-Ranges").trimmed().toLower() == b"bytes"
+            self._validator = self._getValidator()
+            if self._resumeByteSize != 0:
+                self._resumeByteSize = 0
+                self._outputByteSize = 0
+                if not self._resetOutput():
+                    self._raiseException(Exceptions.FileSystemError(self.file))
+                    return
+        elif statusCode == 206 and self._resumeByteSize != 0:
+            if not self._reply.rawHeader(b"Content-Range").trimmed().startsWith(f"bytes {self._resumeByteSize}-".encode()):
+                self._rangeSupported = False
+                self._reply.abort()
+                return
+        else:
+            return
+        contentLength = self._reply.header(QtNetwork.QNetworkRequest.KnownHeaders.ContentLengthHeader)
+        if contentLength != None and Config.FILE_PREALLOCATION_ENABLED:
+            self._preallocateOutput(self._outputByteSize, int(contentLength))
+
+    def _getValidator(self) -> QtCore.QByteArray | None:
+        for header in (b"ETag", b"Last-Modified"):
+            if self._reply.hasRawHeader(header):
+                return self._reply.rawHeader(header)
+        return None
+
+    def _getExpectedStatusCode(self) -> int:
+        return 200 if self._resumeByteSize == 0 else 206
+
     def _onReadyRead(self) -> None:
-        if self._reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 200:
-            bytesWritten = self.file.write(self._reply.readAll())
-            if bytesWritten == -1:
+        if self._reply == None:
+            return
+        if self._bandwidthLimiter == None or not self._bandwidthLimiter.isLimited() or self._reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) != self._getExpectedStatusCode():
+            self._readReply()
+            return
+        self._readReply(self._bandwidthLimiter.acquire(self.getGroup(), self._reply.bytesAvailable()))
+        if self._reply != None and self._reply.bytesAvailable() != 0 and not self._readTimer.isActive():
+            self._readTimer.start(max(self._bandwidthLimiter.getWaitTime(self.getGroup(), min(self._reply.bytesAvailable(), Config.FILE_BANDWIDTH_MIN_READ_SIZE)), 1))
+
+    def _readReply(self, byteSize: int | None = None) -> None:
+        if self._reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) != self._getExpectedStatusCode():
+            self._reply.readAll()
+            return
+        data = self._reply.readAll() if byteSize == None else QtCore.QByteArray(self._reply.read(byteSize))
+        if data.size() != 0:
+            if self._writeOutput(data):
+                self._outputByteSize += data.size()
+            else:
                 self._raiseException(Exceptions.FileSystemError(self.file))
 
     def _onFinished(self) -> None:
-        self.file.close()
+        self._readTimer.stop()
+        self._cancelHedge()
+        if self._error == None and self._reply.bytesAvailable() != 0:
+            if self._bandwidthLimiter != None:
+                self._bandwidthLimiter.consume(self.getGroup(), self._reply.bytesAvailable())
+            self._readReply()
+        if not self._flushOutput():
+            if self._retryScheduled:
+                self._outputByteSize = 0
+            else:
+                self._raiseException(Exceptions.FileSystemError(self.file))
+        self._closeOutput()
         self._reply = None
         if self._retryScheduled:
-            self.file.remove()
+            if not self._rangeSupported or self._outputByteSize == 0:
+                self._discardOutput()
         elif self._error == None:
             self._setFinished()
 
+    def _openOutput(self, append: bool = False) -> bool:
+        self._preallocated = False
+        if append:
+            return self.file.open(QtCore.QIODevice.OpenModeFlag.ReadWrite | QtCore.QIODevice.OpenModeFlag.ExistingOnly) and self.file.seek(self._resumeByteSize)
+        else:
+            return self.file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+
+    def _preallocateOutput(self, offset: int, byteSize: int) -> None:
+        if hasattr(os, "posix_fallocate") and byteSize > 0 and self.file.handle() != -1:
+            try:
+                os.posix_fallocate(self.file.handle(), offset, byteSize)
+                self._preallocated = True
+            except OSError:
+                pass
+
+    def _resetOutput(self) -> bool:
+        self._writeBuffer.truncate(0)
+        return self.file.resize(0) and self.file.seek(0)
+
+    def _writeOutput(self, data: QtCore.QByteArray) -> bool:
+        if self._writeBuffer.size() + data.size() < Config.FILE_WRITE_BUFFER_SIZE:
+            self._writeBuffer.append(data)
+            return True
+        return self._flushOutput() and self.file.write(data) != -1
+
+    def _flushOutput(self) -> bool:
+        if self._writeBuffer.size() == 0:
+            return True
+        succeeded = self.file.write(self._writeBuffer) != -1
+        self._writeBuffer.truncate(0)
+        return succeeded
+
+    def _closeOutput(self) -> None:
+        if self._preallocated and self.file.size() > self._outputByteSize:
+            self.file.resize(self._outputByteSize)
+        self._preallocated = False
+        self.file.close()
+
+    def _discardOutput(self) -> None:
+        self.file.remove()
+
     def _onNetworkError(self, error: QtNetwork.QNetworkReply.NetworkError) -> None:
-        self._raiseException(Exceptions.NetworkError(self._reply))
+        if self._hedgeReply != None and self._error == None:
+            self._adoptHedge()
+        else:
+            self._raiseException(Exceptions.NetworkError(self._reply))
 
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError) -> None:
         if self._error != None:
@@ -97,12 +342,16 @@ class FileDownloader(QtCore.QObject):
             self._retryCount += 1
             self._retryScheduled = True
             self._error = None
-            self._retryRequired.emit(self)
-            self._retryTimer.start(self._retryCount * Config.FILE_REQUEST_RETRY_INTERVAL)
+            self._retryRequired.emit(self, exception)
+            self._retryTimer.start(self._getRetryInterval())
         else:
             self.errorOccurred.emit(self)
             self._setFinished()
 
+    def _getRetryInterval(self) -> int:
+        interval = min(Config.FILE_REQUEST_RETRY_INTERVAL * 2 ** (self._retryCount - 1), Config.FILE_REQUEST_RETRY_MAX_INTERVAL)
+        return random.randint(interval // 2, interval)
+
     def _retryTimerTimeout(self) -> None:
         if self._error == None:
             self._retryScheduled = False
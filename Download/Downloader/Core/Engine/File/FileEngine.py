@@ -1,50 +1,126 @@
+from ..Config import Config
 from ..BaseEngine import BaseEngine
 from ..File.FileDownloader import FileDownloader
+from ..File.RangeDownloader import RangeDownloader
 
 from Core import App
 from Core.GlobalExceptions import Exceptions
+from Services.Utils.Utils import Utils
 from Services.Logging.Logger import Logger
 from Download.DownloadInfo import DownloadInfo
 from Download.Downloader.Core.Engine import Modules
 
-from PyQt6 import QtCore
+from PyQt6 import QtCore, QtNetwork
+
+import re
 
 
 class FileEngine(BaseEngine):
     def __init__(self, downloadInfo: DownloadInfo, status: Modules.Status, progress: Modules.Progress, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(downloadInfo, status, progress, logger, parent=parent)
-        self._fileDownloader: FileDownloader | None = None
+        self._fileDownloaders: list[FileDownloader] = []
+        self._probeReply: QtNetwork.QNetworkReply | None = None
+        self._contentByteSize = 0
+        self._rangeDownloadEnabled = False
 
     def start(self) -> None:
         super().start()
-        self._fileDownloader = FileDownloader(
-            self._networkAccessManager,
-            self.downloadInfo.getUrl(),
-            self.downloadInfo.getAbsoluteFileName(),
-            priority=self.downloadInfo.getPriority(),
-            parent=self
-        )
-        self._fileDownloader.progressChanged.connect(self._updateProgress)
-        self._fileDownloader.errorOccurred.connect(self._fileDownloadFailed)
-        self._fileDownloader.finished.connect(self._fileDownloadFinished)
-        App.FileDownloadManager.startDownload(self._fileDownloader)
+        if Config.FILE_RANGE_DOWNLOAD_ENABLED and Config.FILE_RANGE_MAX_CONNECTION_COUNT > 1:
+            self._probe()
+        else:
+            self._startDownload()
+
+    def _probe(self) -> None:
+        request = QtNetwork.QNetworkRequest(self.downloadInfo.getUrl())
+        request.setTransferTimeout(Config.FILE_REQUEST_TIMEOUT)
+        request.setRawHeader(b"Range", b"bytes=0-0")
+        self._probeReply = self._networkAccessManager.get(request)
+        self._probeReply.metaDataChanged.connect(self._onProbeMetaDataChanged)
+        self._probeReply.finished.connect(self._onProbeFinished)
+
+    def _onProbeMetaDataChanged(self) -> None:
+        if self._probeReply == None:
+            return
+        if self._probeReply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 206:
+            match = re.fullmatch(r"bytes 0-0/(\d+)", self._probeReply.rawHeader(b"Content-Range").trimmed().data().decode(errors="ignore"))
+            if match != None:
+                self._contentByteSize = int(match.group(1))
+        self._probeReply.abort()
+
+    def _onProbeFinished(self) -> None:
+        self._probeReply.deleteLater()
+        self._probeReply = None
+        if self.status.terminateState.isProcessing():
+            self._finish()
+        else:
+            self._startDownload()
+
+    def _startDownload(self) -> None:
+        connectionCount = min(Config.FILE_RANGE_MAX_CONNECTION_COUNT, self._contentByteSize // max(Config.FILE_RANGE_MIN_BYTE_SIZE, 1))
+        if connectionCount > 1:
+            if not self.file.resize(self._contentByteSize):
+                self._raiseException(Exceptions.FileSystemError(self.file))
+                self._finish()
+                return
+            self._rangeDownloadEnabled = True
+            self.logger.info(f"Using Ranged Download: {connectionCount} connections for {Utils.formatByteSize(self._contentByteSize)}")
+            partByteSize = self._contentByteSize // connectionCount
+            for index in range(connectionCount):
+                self._fileDownloaders.append(
+                    RangeDownloader(
+                        self._networkAccessManager,
+                        self.downloadInfo.getUrl(),
+                        self.downloadInfo.getAbsoluteFileName(),
+                        index * partByteSize,
+                        self._contentByteSize - 1 if index == connectionCount - 1 else (index + 1) * partByteSize - 1,
+                        priority=self.downloadInfo.getPriority(),
+                        parent=self
+                    )
+                )
+        else:
+            self._fileDownloaders.append(
+                FileDownloader(
+                    self._networkAccessManager,
+                    self.downloadInfo.getUrl(),
+                    self.downloadInfo.getAbsoluteFileName(),
+                    priority=self.downloadInfo.getPriority(),
+                    parent=self
+                )
+            )
+        for fileDownloader in self._fileDownloaders:
+            fileDownloader.progressChanged.connect(self._updateProgress)
+            fileDownloader.errorOccurred.connect(self._fileDownloadFailed)
+            fileDownloader.finished.connect(self._fileDownloadFinished)
+        App.FileDownloadManager.startDownloads(self._fileDownloaders)
 
     def _updateProgress(self, bytesReceived: int, bytesTotal: int) -> None:
-        self.progress.totalByteSize = bytesReceived
-        self.progress.byteSize = bytesTotal
+        if len(self._fileDownloaders) == 1:
+            self.progress.totalByteSize = bytesReceived
+            self.progress.byteSize = bytesTotal
+        else:
+            self.progress.totalByteSize = sum(fileDownloader.bytesReceived for fileDownloader in self._fileDownloaders)
+            self.progress.byteSize = self._contentByteSize
         self._syncProgress()
 
     def _fileDownloadFailed(self, fileDownloader: FileDownloader) -> None:
-        super()._raiseException(fileDownloader.getError())
+        self._raiseException(fileDownloader.getError())
 
     def _fileDownloadFinished(self, fileDownloader: FileDownloader) -> None:
-        self._finish()
+        if all(fileDownloader.isFinished() for fileDownloader in self._fileDownloaders):
+            self._finish()
 
     def _finish(self) -> None:
-        self._fileDownloader.setParent(None)
-        self._fileDownloader = None
+        for fileDownloader in self._fileDownloaders:
+            fileDownloader.setParent(None)
+        self._fileDownloaders = []
         super()._finish()
 
+    def _isFileRemoveRequired(self) -> bool:
+        return super()._isFileRemoveRequired() or (self._rangeDownloadEnabled and self.status.getError() != None)
+
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError) -> None:
         super()._raiseException(exception)
-        App.FileDownloadManager.cancelDownload(self._fileDownloader)
\ No newline at end of file
+        if self._probeReply != None:
+            self._probeReply.abort()
+        else:
+            App.FileDownloadManager.cancelDownloads(fileDownloader for fileDownloader in self._fileDownloaders if not fileDownloader.isFinished())
\ No newline at end of file
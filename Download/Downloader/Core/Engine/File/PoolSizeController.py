@@ -0,0 +1,96 @@
+from ..Config import Config
+
+from PyQt6 import QtNetwork
+
+
+class PoolSizeController:
+    CONGESTION_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.TimeoutError,
+        QtNetwork.QNetworkReply.NetworkError.OperationCanceledError,
+        QtNetwork.QNetworkReply.NetworkError.RemoteHostClosedError,
+        QtNetwork.QNetworkReply.NetworkError.InternalServerError,
+        QtNetwork.QNetworkReply.NetworkError.ServiceUnavailableError,
+        QtNetwork.QNetworkReply.NetworkError.UnknownServerError
+    )
+
+    def __init__(self, minPoolSize: int, maxPoolSize: int, poolSize: int):
+        self._minPoolSize = minPoolSize
+        self._maxPoolSize = maxPoolSize
+        self._poolSize = poolSize
+        self._goodput = 0.0
+        self._latency: float | None = None
+        self._increased = False
+        self._holdCount = 0
+        self._byteSize = 0
+        self._totalLatency = 0.0
+        self._requestCount = 0
+        self._errorCount = 0
+        self._elapsedSeconds = 0.0
+
+    def reset(self, poolSize: int) -> None:
+        self._poolSize = self._clamp(poolSize)
+        self._goodput = 0.0
+        self._latency = None
+        self._increased = False
+        self._holdCount = 0
+        self._resetWindow()
+
+    def getPoolSize(self) -> int:
+        return self._poolSize
+
+    def getGoodput(self) -> float:
+        return self._goodput
+
+    def getLatency(self) -> float | None:
+        return self._latency
+
+    def addRequest(self, byteSize: int, latency: float) -> None:
+        self._byteSize += byteSize
+        self._totalLatency += latency
+        self._requestCount += 1
+
+    def addError(self, error: QtNetwork.QNetworkReply.NetworkError) -> None:
+        if error in self.CONGESTION_ERRORS:
+            self._errorCount += 1
+
+    def update(self, elapsedSeconds: float, saturated: bool) -> int:
+        self._elapsedSeconds += elapsedSeconds
+        sampleCount = self._requestCount + self._errorCount
+        if sampleCount < Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_MIN_SAMPLE_COUNT:
+            return self._poolSize
+        goodput = self._byteSize / self._elapsedSeconds
+        latency = None if self._requestCount == 0 else self._totalLatency / self._requestCount
+        tolerance = Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_TOLERANCE
+        if self._errorCount / sampleCount > Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_MAX_ERROR_RATE:
+            self._poolSize = self._clamp(int(self._poolSize * Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_DECREASE_FACTOR))
+            self._increased = False
+            self._holdCount = Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_HOLD_COUNT
+        elif saturated:
+            if self._increased and goodput < self._goodput * (1 + tolerance):
+                self._poolSize = self._clamp(self._poolSize - 1)
+                self._increased = False
+                self._holdCount = Config.FILE_DOWNLOAD_MANAGER_ADAPTIVE_HOLD_COUNT
+            elif not self._increased and goodput < self._goodput * (1 - tolerance) and latency != None and self._latency != None and latency > self._latency * (1 + tolerance):
+                self._poolSize = self._clamp(self._poolSize - 1)
+            elif self._holdCount != 0:
+                self._holdCount -= 1
+            else:
+                poolSize = self._clamp(self._poolSize + 1)
+                self._increased = poolSize != self._poolSize
+                self._poolSize = poolSize
+        else:
+            self._increased = False
+        self._goodput = goodput
+        self._latency = latency
+        self._resetWindow()
+        return self._poolSize
+
+    def _resetWindow(self) -> None:
+        self._byteSize = 0
+        self._totalLatency = 0.0
+        self._requestCount = 0
+        self._errorCount = 0
+        self._elapsedSeconds = 0.0
+
+    def _clamp(self, poolSize: int) -> int:
+        return min(max(poolSize, self._minPoolSize), self._maxPoolSize)
\ No newline at end of file
@@ -0,0 +1,38 @@
+from .FileDownloader import FileDownloader
+
+from PyQt6 import QtCore, QtNetwork
+
+
+class RangeDownloader(FileDownloader):
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, url: QtCore.QUrl, filePath: str, rangeStart: int, rangeEnd: int, priority: int = 0, parent: QtCore.QObject | None = None):
+        super().__init__(networkAccessManager, url, filePath, priority=priority, parent=parent)
+        self.rangeStart = rangeStart
+        self.rangeEnd = rangeEnd
+        self._rangeSupported = True
+
+    def getByteSize(self) -> int:
+        return self.rangeEnd - self.rangeStart + 1
+
+    def _setRequestRange(self) -> None:
+        self._request.setRawHeader(b"Range", f"bytes={self.rangeStart + self._resumeByteSize}-{self.rangeEnd}".encode())
+        self._request.setRawHeader(b"If-Range", QtCore.QByteArray() if self._validator == None else self._validator)
+
+    def _getExpectedStatusCode(self) -> int:
+        return 206
+
+    def _onMetaDataChanged(self) -> None:
+        if self._reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) in (200, 206):
+            if self._reply.rawHeader(b"Content-Range").trimmed().startsWith(f"bytes {self.rangeStart + self._resumeByteSize}-{self.rangeEnd}/".encode()):
+                if self._validator == None:
+                    self._validator = self._getValidator()
+            else:
+                self._reply.abort()
+
+    def _onDownloadProgress(self, bytesReceived: int, bytesTotal: int) -> None:
+        self._setDownloadProgress(self._resumeByteSize + bytesReceived, self.getByteSize())
+
+    def _openOutput(self, append: bool = False) -> bool:
+        return self.file.open(QtCore.QIODevice.OpenModeFlag.ReadWrite | QtCore.QIODevice.OpenModeFlag.ExistingOnly) and self.file.seek(self.rangeStart + self._resumeByteSize)
+
+    def _discardOutput(self) -> None:
+        return
\ No newline at end of file
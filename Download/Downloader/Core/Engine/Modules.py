@@ -1,5 +1,3 @@
-from .Config import Config
-
 from Services.Utils.Utils import Utils
 
 from PyQt6 import QtCore
@@ -59,7 +57,10 @@ class Status(QtCore.QObject):
         self.terminateState = State(parent=self)
         self._status = Status.PREPARING
         self._nextUpdate: QtCore.QDateTime | None = None
+        self._refreshInterval: int | None = None
+        self._liveLag: int | None = None
         self._waitingCount = 0
+        self._maxWaitingCount = 0
         self._error = None
         self._fileRemoved = False
 
@@ -78,14 +79,29 @@ class Status(QtCore.QObject):
     def getNextUpdateDateTime(self) -> QtCore.QDateTime | None:
         return self._nextUpdate
 
+    def setRefreshInterval(self, refreshInterval: int | None) -> None:
+        self._refreshInterval = refreshInterval
+
+    def getRefreshInterval(self) -> int | None:
+        return self._refreshInterval
+
+    def setLiveLagMilliseconds(self, liveLag: int | None) -> None:
+        self._liveLag = liveLag
+
+    def getLiveLagMilliseconds(self) -> int | None:
+        return self._liveLag
+
     def setWaitingCount(self, waitingCount: int) -> None:
         self._waitingCount = waitingCount
 
     def getWaitingCount(self) -> int:
         return self._waitingCount
 
+    def setMaxWaitingCount(self, maxWaitingCount: int) -> None:
+        self._maxWaitingCount = maxWaitingCount
+
     def getMaxWaitingCount(self) -> int:
-        return Config.UPDATE_TRACK_MAX_RETRY_COUNT
+        return self._maxWaitingCount
 
     def setDone(self) -> None:
         self._status = Status.DONE
@@ -0,0 +1,94 @@
+from Services.Temp.TempManager import SafeTempDirectory
+from Download.DownloadInfo import DownloadInfo
+
+from PyQt6 import QtCore
+
+import json
+
+
+class DownloadManifest:
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self.url = ""
+        self.contentId = ""
+        self.resolution = ""
+        self.fileName = ""
+        self.range: tuple[int | None, int | None] = (None, None)
+        self.segmentRange: tuple[int | None, int | None] = (None, None)
+        self.sequence: int | None = None
+        self.byteSize = 0
+        self.segments: set[int] = set()
+
+    def setup(self, downloadInfo: DownloadInfo) -> None:
+        self.url = downloadInfo.getUrl().toString()
+        self.contentId = downloadInfo.content.id
+        self.resolution = downloadInfo.resolution.groupId
+        self.fileName = downloadInfo.getAbsoluteFileName()
+        self.range = downloadInfo.getCropRangeMilliseconds()
+        self.segmentRange = self.range
+
+    def matches(self, downloadInfo: DownloadInfo) -> bool:
+        return self.contentId == downloadInfo.content.id and self.resolution == downloadInfo.resolution.groupId and self.fileName == downloadInfo.getAbsoluteFileName() and downloadInfo.getCropRangeMilliseconds() in (self.range, self.segmentRange)
+
+    def isResumable(self, downloadInfo: DownloadInfo) -> bool:
+        return not downloadInfo.isRemuxEnabled() and self.matches(downloadInfo) and QtCore.QFileInfo(downloadInfo.getAbsoluteFileName()).size() >= self.byteSize
+
+    @classmethod
+    def findResumableDirectories(cls, downloadInfo: DownloadInfo) -> list[str]:
+        paths = []
+        for path in SafeTempDirectory.findResumableDirectories(downloadInfo.directory):
+            manifest = cls(SafeTempDirectory.getDirectoryManifestPath(path))
+            if manifest.load() and manifest.isResumable(downloadInfo):
+                paths.append(path)
+        return paths
+
+    def setMerged(self, sequence: int, byteSize: int) -> None:
+        self.sequence = sequence
+        self.byteSize = byteSize
+        self.segments.discard(sequence)
+
+    def load(self) -> bool:
+        file = QtCore.QFile(self.path)
+        if not file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
+            return False
+        try:
+            data = json.loads(file.readAll().data().decode())
+            if data["version"] != self.VERSION:
+                return False
+            self.url = data["url"]
+            self.contentId = data["contentId"]
+            self.resolution = data["resolution"]
+            self.fileName = data["fileName"]
+            self.range = tuple(data["range"])
+            self.segmentRange = tuple(data["segmentRange"])
+            self.sequence = data["sequence"]
+            self.byteSize = data["byteSize"]
+            self.segments = set(data["segments"])
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+            return False
+        finally:
+            file.close()
+        return True
+
+    def save(self) -> bool:
+        file = QtCore.QSaveFile(self.path)
+        if not file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly):
+            return False
+        data = {
+            "version": self.VERSION,
+            "url": self.url,
+            "contentId": self.contentId,
+            "resolution": self.resolution,
+            "fileName": self.fileName,
+            "range": self.range,
+            "segmentRange": self.segmentRange,
+            "sequence": self.sequence,
+            "byteSize": self.byteSize,
+            "segments": sorted(self.segments)
+        }
+        if file.write(json.dumps(data).encode()) == -1:
+            file.cancelWriting()
+            return False
+        return file.commit()
\ No newline at end of file
@@ -1,5 +1,7 @@
 from ..Config import Config
-from ..File import FileDownloadManager
+from .SegmentDownloader import SegmentDownloader
+from .SegmentSpool import SegmentSpool
+from .MuteMap import MuteMap
 
 from Core.GlobalExceptions import Exceptions
 from Services.Playlist.Segment import Segment
@@ -7,66 +9,139 @@ from Services.Playlist.Segment import Segment
 from PyQt6 import QtCore, QtNetwork
 
 
-class MutableSegmentDownloader(FileDownloadManager.FileDownloader):
-    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, parent: QtCore.QObject | None = None):
-        self.segment = segment
-        fileName = self.segment.url.fileName()
+class MutableSegmentDownloader(SegmentDownloader):
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, spooled: bool = False, segmentSpool: SegmentSpool | None = None, muteMap: MuteMap | None = None, parent: QtCore.QObject | None = None):
+        fileName = segment.url.fileName()
         if "." in fileName:
             name, extension = fileName.rsplit(".", 1)
         else:
             name = fileName
             extension = None
-        for key in ["-muted", "-unmuted"]:
+        self._listedVariant = MuteMap.Variants.ORIGINAL
+        for key, variant in [("-muted", MuteMap.Variants.MUTED), ("-unmuted", MuteMap.Variants.UNMUTED)]:
             if name.endswith(key):
                 name = name.rsplit(key, 1)[0]
+                self._listedVariant = variant
                 break
         if extension == None:
-            self._originalUrl = self.segment.url.resolved(QtCore.QUrl(name))
-            self._mutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-muted"))
-            self._unmutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-unmuted"))
+            self._urls = {
+                MuteMap.Variants.ORIGINAL: segment.url.resolved(QtCore.QUrl(name)),
+                MuteMap.Variants.UNMUTED: segment.url.resolved(QtCore.QUrl(f"{name}-unmuted")),
+                MuteMap.Variants.MUTED: segment.url.resolved(QtCore.QUrl(f"{name}-muted"))
+            }
         else:
-            self._originalUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}.{extension}"))
-            self._mutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-muted.{extension}"))
-            self._unmutedUrl = self.segment.url.resolved(QtCore.QUrl(f"{name}-unmuted.{extension}"))
-        super().__init__(networkAccessManager, self._originalUrl, filePath, priority=priority, parent=parent)
-        self._unmuted = False
-        self._muted = False
+            self._urls = {
+                MuteMap.Variants.ORIGINAL: segment.url.resolved(QtCore.QUrl(f"{name}.{extension}")),
+                MuteMap.Variants.UNMUTED: segment.url.resolved(QtCore.QUrl(f"{name}-unmuted.{extension}")),
+                MuteMap.Variants.MUTED: segment.url.resolved(QtCore.QUrl(f"{name}-muted.{extension}"))
+            }
+        super().__init__(networkAccessManager, segment, filePath, priority=priority, spooled=spooled, segmentSpool=segmentSpool, parent=parent)
+        self._muteMap = MuteMap() if muteMap == None else muteMap
+        self._variants = self._muteMap.getVariants(self._listedVariant)
+        self._variantIndex = 0
+        self._planned = False
+        self._probeReplies: dict[MuteMap.Variants, QtNetwork.QNetworkReply] = {}
+        self._unavailableVariants: set[MuteMap.Variants] = set()
+        self._setVariant(0)
 
     def getPriority(self) -> int:
-        return super().getPriority() + 1 if self._unmuted or self._muted else 0
+        return super().getPriority() + 1 if self._variantIndex != 0 else 0
+
+    def _setVariant(self, index: int) -> None:
+        self._variantIndex = index
+        self.url = self._urls[self._variants[self._variantIndex]]
+        self._request.setUrl(self.url)
+
+    def _startHandler(self) -> None:
+        if self._reply != None or len(self._probeReplies) != 0:
+            return
+        if not self._planned:
+            self._planned = True
+            self._variants = self._muteMap.getVariants(self._listedVariant)
+            self._setVariant(0)
+            for variant in self._getProbeVariants():
+                request = QtNetwork.QNetworkRequest(self._urls[variant])
+                request.setTransferTimeout(Config.FILE_REQUEST_TIMEOUT)
+                reply = self._networkAccessManager.head(request)
+                reply.finished.connect(lambda variant=variant: self._onProbeFinished(variant))
+                self._probeReplies[variant] = reply
+            if len(self._probeReplies) != 0:
+                return
+        super()._startHandler()
+
+    def _getProbeVariants(self) -> list[MuteMap.Variants]:
+        variants = []
+        if not Config.SEGMENT_MUTE_PROBE_ENABLED:
+            return variants
+        for variant in self._variants[:-1]:
+            if self._muteMap.isAvailable(self._listedVariant, variant):
+                break
+            variants.append(variant)
+        return variants
+
+    def _onProbeFinished(self, variant: MuteMap.Variants) -> None:
+        reply = self._probeReplies.pop(variant)
+        statusCode = reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if statusCode == 200:
+            self._muteMap.recordSuccess(self._listedVariant, variant)
+        elif statusCode in MuteMap.UNAVAILABLE_STATUS_CODES:
+            self._muteMap.recordFailure(self._listedVariant, variant)
+            self._unavailableVariants.add(variant)
+        for candidate in self._variants:
+            if candidate in self._probeReplies:
+                return
+            elif candidate not in self._unavailableVariants:
+                break
+        self._cancelProbes()
+        self._variants = [candidate for candidate in self._variants if candidate not in self._unavailableVariants]
+        self._setVariant(0)
+        if self._error == None:
+            super()._startHandler()
+
+    def _cancelProbes(self) -> None:
+        probeReplies = list(self._probeReplies.values())
+        self._probeReplies.clear()
+        for reply in probeReplies:
+            reply.finished.disconnect()
+            reply.abort()
 
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError) -> None:
         if self._error != None:
             return
         self._error = exception
+        self._cancelProbes()
         if self._reply != None:
             self._reply.abort()
         if self._retryTimer.isActive():
             self._retryTimer.stop()
-        if isinstance(exception, Exceptions.NetworkError) and (self._unmuted == False or self._muted == False):
+        if isinstance(exception, Exceptions.NetworkError) and exception.reasonCode in MuteMap.UNAVAILABLE_ERRORS:
+            self._muteMap.recordFailure(self._listedVariant, self._variants[self._variantIndex])
+        if isinstance(exception, Exceptions.NetworkError) and self._variantIndex < len(self._variants) - 1:
             self._retryScheduled = True
+            self._rangeSupported = False
             self._error = None
-            if self._unmuted == False:
-                self._unmuted = True
-                self.url = self._unmutedUrl
-            else:
-                self._muted = True
-                self.url = self._mutedUrl
-            self._request.setUrl(self.url)
-            self._retryRequired.emit(self)
+            self._setVariant(self._variantIndex + 1)
+            self._retryRequired.emit(self, exception)
             self._retryTimerTimeout()
         elif isinstance(exception, Exceptions.NetworkError) and self._retryCount < Config.FILE_REQUEST_MAX_RETRY_COUNT:
-            self._unmuted = False
-            self._muted = False
+            url = self.url
             self._retryCount += 1
             self._retryScheduled = True
+            self._variants = self._muteMap.getVariants(self._listedVariant)
+            self._setVariant(0)
+            if self.url != url:
+                self._rangeSupported = False
             self._error = None
-            self._request.setUrl(self._originalUrl)
-            self._retryRequired.emit(self)
-            self._retryTimer.start(self._retryCount * Config.FILE_REQUEST_RETRY_INTERVAL)
+            self._retryRequired.emit(self, exception)
+            self._retryTimer.start(self._getRetryInterval())
         else:
             self.errorOccurred.emit(self)
             self._setFinished()
 
+    def _setFinished(self) -> None:
+        if not self._finished and self._error == None:
+            self._muteMap.recordSuccess(self._listedVariant, self._variants[self._variantIndex])
+        super()._setFinished()
+
     def isMuted(self) -> bool:
-        return self._muted
\ No newline at end of file
+        return self._variants[self._variantIndex] == MuteMap.Variants.MUTED
\ No newline at end of file
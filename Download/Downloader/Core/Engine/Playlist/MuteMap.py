@@ -0,0 +1,43 @@
+from ..Config import Config
+
+from PyQt6 import QtNetwork
+
+import enum
+
+
+class MuteMap:
+    class Variants(enum.Enum):
+        ORIGINAL = "original"
+        UNMUTED = "unmuted"
+        MUTED = "muted"
+
+    UNAVAILABLE_ERRORS = (
+        QtNetwork.QNetworkReply.NetworkError.ContentAccessDenied,
+        QtNetwork.QNetworkReply.NetworkError.ContentNotFoundError,
+        QtNetwork.QNetworkReply.NetworkError.ContentGoneError
+    )
+    UNAVAILABLE_STATUS_CODES = (403, 404, 410)
+
+    def __init__(self):
+        self._successCounts: dict[tuple[Variants, Variants], int] = {}
+        self._failureCounts: dict[tuple[Variants, Variants], int] = {}
+
+    def getVariants(self, listedVariant: Variants) -> list[Variants]:
+        variants = [variant for variant in self.Variants if not self.isUnavailable(listedVariant, variant)]
+        return variants + [variant for variant in self.Variants if variant not in variants]
+
+    def isAvailable(self, listedVariant: Variants, variant: Variants) -> bool:
+        if variant == listedVariant:
+            return True
+        return self._successCounts.get((listedVariant, variant), 0) != 0 and self._failureCounts.get((listedVariant, variant), 0) == 0
+
+    def isUnavailable(self, listedVariant: Variants, variant: Variants) -> bool:
+        if variant == listedVariant:
+            return False
+        return self._successCounts.get((listedVariant, variant), 0) == 0 and self._failureCounts.get((listedVariant, variant), 0) >= Config.SEGMENT_MUTE_MAP_MIN_FAILURE_COUNT
+
+    def recordSuccess(self, listedVariant: Variants, variant: Variants) -> None:
+        self._successCounts[(listedVariant, variant)] = self._successCounts.get((listedVariant, variant), 0) + 1
+
+    def recordFailure(self, listedVariant: Variants, variant: Variants) -> None:
+        self._failureCounts[(listedVariant, variant)] = self._failureCounts.get((listedVariant, variant), 0) + 1
\ No newline at end of file
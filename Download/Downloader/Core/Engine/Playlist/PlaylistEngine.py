@@ -1,7 +1,10 @@
 from ..Config import Config
 from ..BaseEngine import BaseEngine
+from .RefreshScheduler import RefreshScheduler
 from .SegmentDownloader import SegmentDownloader
-from ..FFmpeg.FFmpeg import FFmpeg
+from .SegmentSpool import SegmentSpool
+from .SegmentTracker import SegmentTracker
+from .SegmentWriter import SegmentWriter
 
 from Core import App
 from Core.GlobalExceptions import Exceptions
@@ -26,48 +29,51 @@ class PlaylistEngine(BaseEngine):
         self._playlistManager.errorOccurred.connect(self._playlistManagerErrorOccurred)
         self._playlistManager.playlistUpdated.connect(self._playlistUpdated)
         self._safeTempDirectory: SafeTempDirectory | None = None
-        self._FFmpeg: FFmpeg | None = None
-        self._segmentDownloaders: list[SegmentDownloader] = []
+        self._segmentTracker = SegmentTracker()
+        self._segmentSpool = SegmentSpool(Config.SEGMENT_SPOOL_MAX_BYTE_SIZE, Config.SEGMENT_SPOOL_GLOBAL_MAX_BYTE_SIZE, parent=self)
+        self._writingSegmentDownloaders: dict[int, SegmentDownloader] = {}
+        self._segmentWriter = SegmentWriter(self.downloadInfo.getAbsoluteFileName(), self.downloadInfo.isRemuxEnabled(), self.logger, Config.SEGMENT_WRITER_MAX_QUEUE_SIZE, parent=self)
+        self._segmentWriter.outputStarted.connect(self._updatePlaylist)
+        self._segmentWriter.segmentWritten.connect(self._segmentWritten)
+        self._segmentWriter.segmentDropped.connect(self._segmentDropped)
+        self._segmentWriter.errorOccurred.connect(self._segmentWriterErrorOccurred)
+        self._segmentWriter.outputFinished.connect(self._segmentWriterFinished)
+        self._segmentWriterRunning = False
+        self._segmentWriterBlocked = False
+        self._refreshScheduler = RefreshScheduler(Config.PLAYLIST_UPDATE_INTERVAL, Config.PLAYLIST_UPDATE_MIN_INTERVAL, Config.PLAYLIST_UPDATE_MAX_INTERVAL)
         self._refreshTimer = QtCore.QTimer(parent=self)
         self._refreshTimer.setSingleShot(True)
-        self._refreshTimer.setInterval(Config.PLAYLIST_UPDATE_INTERVAL)
         self._refreshTimer.timeout.connect(self._updatePlaylist)
 
     def start(self) -> None:
         super().start()
-        self._safeTempDirectory = SafeTempDirectory(self.downloadInfo.directory, parent=self)
+        self._safeTempDirectory = self._createTempDirectory()
         if self._safeTempDirectory.getError() == None:
             self.logger.info(f"Using Temp Directory: {self._safeTempDirectory.path()}")
-            if self.downloadInfo.isRemuxEnabled():
-                self._startFFmpegProcess()
-            else:
-                self._updatePlaylist()
+            self._segmentWriterRunning = True
+            self._segmentWriter.start()
         else:
             self._raiseException(self._safeTempDirectory.getError())
             self._finish()
 
+    def _createTempDirectory(self) -> SafeTempDirectory:
+        return SafeTempDirectory(self.downloadInfo.directory, parent=self)
+
     def _finish(self) -> None:
+        if Config.FILE_HEDGING_ENABLED:
+            self.logger.info(f"Hedged Requests: <Total: {App.FileDownloadManager.getHedgeCount()} / Budget: {App.FileDownloadManager.getHedgeBudget()}>")
+        self._segmentSpool.clear()
+        self._segmentWriter.wait()
         if self._safeTempDirectory.getError() == None:
             self._safeTempDirectory.clear()
         super()._finish()
 
-    def _startFFmpegProcess(self) -> None:
-        self._FFmpeg = FFmpeg(self.logger, parent=self)
-        self._FFmpeg.started.connect(self._updatePlaylist)
-        self._FFmpeg.finished.connect(self._FFmpegProcessFinished)
-        self._FFmpeg.start(
-            outputTarget=self.downloadInfo.getAbsoluteFileName(),
-            transcode=False
-        )
+    def _segmentWriterErrorOccurred(self, exception: Exceptions.FileSystemError | Exceptions.ProcessError | Exceptions.UnexpectedError) -> None:
+        self._raiseException(exception)
 
-    def _FFmpegProcessFinished(self) -> None:
-        exception = self._FFmpeg.getError()
-        self._FFmpeg.deleteLater()
-        self._FFmpeg = None
-        if exception == None:
-            self._checkDone()
-        else:
-            self._raiseException(exception)
+    def _segmentWriterFinished(self) -> None:
+        self._segmentWriterRunning = False
+        self._checkDone()
 
     def _updatePlaylist(self) -> None:
         self._playlistManager.update()
@@ -77,7 +83,8 @@ class PlaylistEngine(BaseEngine):
 
     def _playlistUpdated(self) -> None:
         if self.status.terminateState.isFalse():
-            if self._playlistManager.hasNewSegments():
+            changed = self._playlistManager.hasNewSegments()
+            if changed:
                 segmentsToDownload = []
                 for segment in self._playlistManager.getNewSegments():
                     self.progress.totalFiles += 1
@@ -92,8 +99,18 @@ class PlaylistEngine(BaseEngine):
                 self._syncProgress()
             if self._playlistManager.playlist.isEndList():
                 self._checkDone()
+            elif changed and self._playlistManager.isBlockingReloadAvailable():
+                self._updatePlaylist()
             else:
-                self._refreshTimer.start()
+                self._scheduleRefresh(changed)
+
+    def _scheduleRefresh(self, changed: bool) -> None:
+        self.status.setRefreshInterval(self._getRefreshInterval(changed))
+        self._syncStatus()
+        self._refreshTimer.start(self.status.getRefreshInterval())
+
+    def _getRefreshInterval(self, changed: bool) -> int:
+        return self._refreshScheduler.getInterval(self._playlistManager.playlist, changed)
 
     def _downloadSegments(self, segments: list[Segment]) -> None:
         segmentDownloaders = []
@@ -102,8 +119,12 @@ class PlaylistEngine(BaseEngine):
             segmentDownloader.errorOccurred.connect(self._segmentDownloadFailed)
             segmentDownloader.finished.connect(self._segmentDownloadFinished)
             segmentDownloaders.append(segmentDownloader)
-        App.FileDownloadManager.startDownloads(segmentDownloaders)
-        self._segmentDownloaders.extend(segmentDownloaders)
+        App.FileDownloadManager.startDownloads(segmentDownloader for segmentDownloader in segmentDownloaders if self._isSegmentDownloadRequired(segmentDownloader))
+        for segmentDownloader in segmentDownloaders:
+            self._segmentTracker.add(segmentDownloader)
+
+    def _isSegmentDownloadRequired(self, segmentDownloader: SegmentDownloader) -> bool:
+        return not segmentDownloader.isFinished()
 
     def _createSegmentDownloader(self, segment: Segment) -> SegmentDownloader:
         return SegmentDownloader(
@@ -111,6 +132,8 @@ class PlaylistEngine(BaseEngine):
             segment,
             Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.ts"),
             priority=self.downloadInfo.getPriority(),
+            spooled=Config.SEGMENT_SPOOL_ENABLED,
+            segmentSpool=self._segmentSpool,
             parent=self
         )
 
@@ -126,47 +149,72 @@ class PlaylistEngine(BaseEngine):
                 self._raiseException(exception)
 
     def _segmentDownloadFinished(self, segmentDownloader: SegmentDownloader) -> None:
-        while len(self._segmentDownloaders) > 0 and self._segmentDownloaders[0].isFinished():
-            nextSegmentDownloader = self._segmentDownloaders.pop(0)
-            if nextSegmentDownloader.getError() == None and not self.status.terminateState.isProcessing():
-                self._mergeSegment(nextSegmentDownloader)
-            nextSegmentDownloader.file.remove()
-            nextSegmentDownloader.setParent(None)
+        self._segmentTracker.setFinished(segmentDownloader)
+        if segmentDownloader.isHedged():
+            self.logger.info(f"Hedged Segment: <Sequence: {segmentDownloader.segment.sequence} / Winner: {'Hedge' if segmentDownloader.isHedgeWon() else 'Original'}>")
+        if segmentDownloader.isSpooled() and (not self._segmentTracker.isHead(segmentDownloader) or self._segmentWriter.isFull()):
+            self._spoolSegment(segmentDownloader)
+        self._processSegments()
+
+    def _processSegments(self) -> None:
+        while self._segmentTracker.isHeadFinished():
+            segmentDownloader = self._segmentTracker.getHead()
+            if segmentDownloader.getError() == None and not self.status.terminateState.isProcessing():
+                if self._segmentWriter.isFull():
+                    if not self._segmentWriterBlocked:
+                        self._segmentWriterBlocked = True
+                        self.logger.info("Segment writer queue is full. Holding finished segments.")
+                    break
+                self._mergeSegment(self._segmentTracker.popHead())
+            else:
+                self._discardSegment(self._segmentTracker.popHead())
         self._checkDone()
 
+    def _spoolSegment(self, segmentDownloader: SegmentDownloader) -> None:
+        if segmentDownloader.getError() == None and not self._segmentSpool.hold(segmentDownloader):
+            if not segmentDownloader.spill():
+                self._raiseException(Exceptions.FileSystemError(segmentDownloader.file))
+
+    def _discardSegment(self, segmentDownloader: SegmentDownloader) -> None:
+        self._segmentSpool.release(segmentDownloader)
+        segmentDownloader.discard()
+        segmentDownloader.setParent(None)
+
     def _checkDone(self) -> None:
-        if len(self._segmentDownloaders) == 0 and not self.status.isDone():
+        if len(self._segmentTracker) == 0 and len(self._writingSegmentDownloaders) == 0 and not self.status.isDone():
             if self.status.terminateState.isProcessing() or self._playlistManager.playlist.isEndList():
-                if self._FFmpeg == None:
+                if not self._segmentWriterRunning:
                     self._finish()
                 elif self.status.terminateState.isProcessing():
-                    self._FFmpeg.terminate()
+                    self._segmentWriter.terminateOutput()
                 else:
-                    self._FFmpeg.closeStream()
+                    self._segmentWriter.closeOutput()
 
     def _mergeSegment(self, segmentDownloader: SegmentDownloader) -> None:
-        if segmentDownloader.file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
-            while not segmentDownloader.file.atEnd():
-                if self.downloadInfo.isRemuxEnabled():
-                    if self._FFmpeg == None:
-                        self.logger.warning("Unable to find pipe target.")
-                        self._raiseException(Exceptions.UnexpectedError())
-                    elif self._FFmpeg.write(segmentDownloader.file.read(Config.FILE_CHUNK_SIZE)) == -1 or not self._FFmpeg.waitForBytesWritten(Config.PIPE_TIMEOUT):
-                        self.logger.warning("Unable to write data to pipe.")
-                        self._raiseException(Exceptions.UnexpectedError())
-                else:
-                    if self.file.write(segmentDownloader.file.read(Config.FILE_CHUNK_SIZE)) == -1:
-                        self.logger.warning("Unable to write data to file.")
-                        self.file.close()
-                        self._raiseException(Exceptions.FileSystemError(self.file))
-            segmentDownloader.file.close()
-            self.progress.files += 1
-            self.progress.milliseconds += segmentDownloader.segment.totalMilliseconds
-            self.progress.byteSize = self.file.size()
-            self.progress.totalByteSize = self.progress.byteSize
-            self._syncProgress()
+        self._writingSegmentDownloaders[segmentDownloader.segment.sequence] = segmentDownloader
+        if segmentDownloader.isSpooled():
+            self._segmentWriter.write(segmentDownloader.segment.sequence, segmentDownloader.getBuffer())
         else:
-            self._raiseException(Exceptions.FileSystemError(segmentDownloader.file))
+            self._segmentWriter.write(segmentDownloader.segment.sequence, segmentDownloader.file.fileName())
+
+    def _segmentWritten(self, sequence: int, byteSize: int) -> None:
+        segmentDownloader = self._writingSegmentDownloaders.pop(sequence)
+        self.progress.files += 1
+        self.progress.milliseconds += segmentDownloader.segment.totalMilliseconds
+        self.progress.byteSize = byteSize
+        self.progress.totalByteSize = self.progress.byteSize
+        self._syncProgress()
+        self._segmentWriterReleased(segmentDownloader)
+
+    def _segmentDropped(self, sequence: int) -> None:
+        self._segmentWriterReleased(self._writingSegmentDownloaders.pop(sequence))
+
+    def _segmentWriterReleased(self, segmentDownloader: SegmentDownloader) -> None:
+        self._discardSegment(segmentDownloader)
+        if self._segmentWriterBlocked and not self._segmentWriter.isFull():
+            self._segmentWriterBlocked = False
+            self.logger.info("Segment writer queue is available. Resuming merge.")
+        self._processSegments()
 
     def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError | Exceptions.ProcessError | Exceptions.UnexpectedError) -> None:
         super()._raiseException(exception)
@@ -174,7 +222,8 @@ class PlaylistEngine(BaseEngine):
             self._refreshTimer.stop()
         if self._playlistManager.isRunning():
             self._playlistManager.abort()
-        if len(self._segmentDownloaders) == 0:
-            self._checkDone()
+        self._segmentWriter.cancel()
+        if self._segmentTracker.getPendingCount() == 0:
+            self._processSegments()
         else:
-            App.FileDownloadManager.cancelDownloads(self._segmentDownloaders)
\ No newline at end of file
+            App.FileDownloadManager.cancelDownloads(self._segmentTracker.getPendingSegmentDownloaders())
\ No newline at end of file
@@ -0,0 +1,30 @@
+from Services.Playlist.Playlist import Playlist
+
+
+class RefreshScheduler:
+    def __init__(self, interval: int, minInterval: int, maxInterval: int):
+        self._interval = interval
+        self._minInterval = minInterval
+        self._maxInterval = maxInterval
+
+    def getInterval(self, playlist: Playlist, changed: bool) -> int:
+        if changed and len(playlist.getSegments()) != 0:
+            return self._clamp(playlist.getSegments()[-1].totalMilliseconds)
+        elif playlist.getTargetDuration() != 0:
+            return self._clamp(playlist.getTargetDuration() * 500)
+        else:
+            return self._clamp(self._interval)
+
+    def getBackOffInterval(self, idleCount: int) -> int:
+        return self._clamp(self._interval * 2 ** max(idleCount, 0))
+
+    def getBackOffIntervals(self, maxTotalInterval: int) -> list[int]:
+        intervals = []
+        while sum(intervals) < maxTotalInterval:
+            remainingInterval = maxTotalInterval - sum(intervals)
+            interval = min(self.getBackOffInterval(len(intervals)), remainingInterval)
+            intervals.append(remainingInterval if remainingInterval - interval < self._interval else interval)
+        return intervals
+
+    def _clamp(self, interval: int) -> int:
+        return min(max(interval, self._minInterval), self._maxInterval)
\ No newline at end of file
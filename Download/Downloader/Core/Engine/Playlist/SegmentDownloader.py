@@ -1,4 +1,5 @@
 from ..File import FileDownloadManager
+from .SegmentSpool import SegmentSpool
 
 from Services.Playlist.Segment import Segment
 
@@ -6,6 +7,94 @@ from PyQt6 import QtCore, QtNetwork
 
 
 class SegmentDownloader(FileDownloadManager.FileDownloader):
-    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, parent: QtCore.QObject | None = None):
+    def __init__(self, networkAccessManager: QtNetwork.QNetworkAccessManager, segment: Segment, filePath: str, priority: int = 0, spooled: bool = False, segmentSpool: SegmentSpool | None = None, parent: QtCore.QObject | None = None):
         super().__init__(networkAccessManager, segment.url, filePath, priority=priority, parent=parent)
-        self.segment = segment
\ No newline at end of file
+        self.segment = segment
+        self._spooled = spooled
+        self._segmentSpool = segmentSpool
+        self._buffer = QtCore.QByteArray()
+
+    def isSpooled(self) -> bool:
+        return self._spooled
+
+    def isHedgeable(self) -> bool:
+        return True
+
+    def getBuffer(self) -> QtCore.QByteArray:
+        return self._buffer
+
+    def getBufferSize(self) -> int:
+        return self._buffer.size()
+
+    def spill(self) -> bool:
+        if not self._spooled:
+            return True
+        succeeded = self._unspool()
+        self.file.close()
+        return succeeded
+
+    def restore(self) -> bool:
+        if not self.file.exists():
+            return False
+        self._spooled = False
+        self._finished = True
+        return True
+
+    def discard(self) -> None:
+        if self._spooled:
+            self._buffer.clear()
+            self._releaseBuffer()
+        else:
+            self.file.remove()
+
+    def _reserveBuffer(self, byteSize: int) -> bool:
+        return self._segmentSpool == None or self._segmentSpool.reserve(self, byteSize)
+
+    def _releaseBuffer(self) -> None:
+        if self._segmentSpool != None:
+            self._segmentSpool.release(self)
+
+    def _unspool(self) -> bool:
+        if not self.file.open(QtCore.QIODevice.OpenModeFlag.WriteOnly):
+            return False
+        succeeded = self.file.write(self._buffer) != -1
+        self._spooled = False
+        self._buffer.clear()
+        self._releaseBuffer()
+        return succeeded
+
+    def _openOutput(self, append: bool = False) -> bool:
+        if not self._spooled:
+            return super()._openOutput(append=append)
+        if not append:
+            self._buffer.clear()
+        return True
+
+    def _resetOutput(self) -> bool:
+        if not self._spooled:
+            return super()._resetOutput()
+        self._buffer.clear()
+        return True
+
+    def _preallocateOutput(self, offset: int, byteSize: int) -> None:
+        if not self._spooled:
+            super()._preallocateOutput(offset, byteSize)
+
+    def _writeOutput(self, data: QtCore.QByteArray) -> bool:
+        if self._spooled:
+            if self._reserveBuffer(max(self._buffer.size() + data.size(), self.bytesTotal)):
+                self._buffer.append(data)
+                return True
+            elif not self._unspool():
+                return False
+        return super()._writeOutput(data)
+
+    def _closeOutput(self) -> None:
+        if not self._spooled:
+            super()._closeOutput()
+
+    def _discardOutput(self) -> None:
+        if self._spooled:
+            self._buffer.clear()
+        else:
+            super()._discardOutput()
\ No newline at end of file
@@ -0,0 +1,90 @@
+from ..Config import Config
+
+from PyQt6 import QtCore
+
+import enum
+import errno
+import os
+import time
+
+
+class SegmentMerger:
+    class Methods(enum.Enum):
+        COPY_FILE_RANGE = "copy_file_range"
+        SENDFILE = "sendfile"
+        BUFFER = "buffer"
+
+    UNSUPPORTED_ERRORS = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF, errno.ENOTSOCK, errno.EOPNOTSUPP)
+
+    def __init__(self, target: QtCore.QFile):
+        self._target = target
+        if hasattr(os, "copy_file_range"):
+            self._method = self.Methods.COPY_FILE_RANGE
+        elif hasattr(os, "sendfile"):
+            self._method = self.Methods.SENDFILE
+        else:
+            self._method = self.Methods.BUFFER
+        self._byteSize = 0
+        self._elapsedSeconds = 0.0
+
+    def getMethod(self) -> Methods:
+        return self._method
+
+    def getByteSize(self) -> int:
+        return self._byteSize
+
+    def getElapsedSeconds(self) -> float:
+        return self._elapsedSeconds
+
+    def getThroughput(self) -> float:
+        return 0 if self._elapsedSeconds == 0 else self._byteSize / self._elapsedSeconds
+
+    def appendData(self, data: QtCore.QByteArray) -> bool:
+        startTime = time.perf_counter()
+        succeeded = self._target.write(data) != -1
+        self._elapsedSeconds += time.perf_counter() - startTime
+        if succeeded:
+            self._byteSize += data.size()
+        return succeeded
+
+    def appendFile(self, source: QtCore.QFile) -> bool:
+        startTime = time.perf_counter()
+        byteSize = source.size()
+        succeeded = self._appendFile(source, byteSize)
+        self._elapsedSeconds += time.perf_counter() - startTime
+        if succeeded:
+            self._byteSize += byteSize
+        return succeeded
+
+    def _appendFile(self, source: QtCore.QFile, byteSize: int) -> bool:
+        position = 0
+        if self._method != self.Methods.BUFFER and source.handle() != -1 and self._target.handle() != -1:
+            if not self._target.flush():
+                return False
+            offset = self._target.pos()
+            try:
+                while position < byteSize:
+                    copiedSize = self._copy(source.handle(), self._target.handle(), position, offset + position, byteSize - position)
+                    if copiedSize == 0:
+                        break
+                    position += copiedSize
+            except OSError as e:
+                if e.errno not in self.UNSUPPORTED_ERRORS:
+                    return False
+                self._method = self.Methods.SENDFILE if self._method == self.Methods.COPY_FILE_RANGE and hasattr(os, "sendfile") else self.Methods.BUFFER
+            if not self._target.seek(offset + position):
+                return False
+        if position < byteSize:
+            if not source.seek(position):
+                return False
+            while not source.atEnd():
+                if self._target.write(source.read(Config.FILE_MERGE_BUFFER_SIZE)) == -1:
+                    return False
+        return True
+
+    def _copy(self, sourceHandle: int, targetHandle: int, sourceOffset: int, targetOffset: int, count: int) -> int:
+        if self._method == self.Methods.COPY_FILE_RANGE:
+            return os.copy_file_range(sourceHandle, targetHandle, count, sourceOffset, targetOffset)
+        else:
+            os.lseek(targetHandle, targetOffset, os.SEEK_SET)
+            return os.sendfile(targetHandle, sourceHandle, sourceOffset, count)
\ No newline at end of file
@@ -0,0 +1,48 @@
+from PyQt6 import QtCore
+
+import threading
+
+
+class SegmentSpool(QtCore.QObject):
+    _globalLock = threading.Lock()
+    _globalByteSize = 0
+
+    def __init__(self, maxByteSize: int, globalMaxByteSize: int, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self._maxByteSize = maxByteSize
+        self._globalMaxByteSize = globalMaxByteSize
+        self._byteSize = 0
+        self._segmentDownloaders: dict[QtCore.QObject, int] = {}
+
+    def reserve(self, segmentDownloader: QtCore.QObject, byteSize: int) -> bool:
+        reservedByteSize = self._segmentDownloaders.get(segmentDownloader, 0)
+        if byteSize <= reservedByteSize:
+            return True
+        increase = byteSize - reservedByteSize
+        with SegmentSpool._globalLock:
+            if self._byteSize + increase > self._maxByteSize or SegmentSpool._globalByteSize + increase > self._globalMaxByteSize:
+                return False
+            SegmentSpool._globalByteSize += increase
+        self._byteSize += increase
+        self._segmentDownloaders[segmentDownloader] = byteSize
+        return True
+
+    def hold(self, segmentDownloader: QtCore.QObject) -> bool:
+        return self.reserve(segmentDownloader, segmentDownloader.getBufferSize())
+
+    def release(self, segmentDownloader: QtCore.QObject) -> None:
+        byteSize = self._segmentDownloaders.pop(segmentDownloader, 0)
+        self._byteSize -= byteSize
+        with SegmentSpool._globalLock:
+            SegmentSpool._globalByteSize -= byteSize
+
+    def clear(self) -> None:
+        for segmentDownloader in list(self._segmentDownloaders):
+            self.release(segmentDownloader)
+
+    def getByteSize(self) -> int:
+        return self._byteSize
+
+    @classmethod
+    def getGlobalByteSize(cls) -> int:
+        return cls._globalByteSize
\ No newline at end of file
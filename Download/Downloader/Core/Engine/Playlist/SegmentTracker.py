@@ -0,0 +1,54 @@
+from .SegmentDownloader import SegmentDownloader
+
+from Services.Playlist.Segment import Segment
+
+import collections
+
+
+class SegmentTracker:
+    def __init__(self):
+        self._sequences: collections.deque[int] = collections.deque()
+        self._segmentDownloaders: dict[int, SegmentDownloader] = {}
+        self._pendingSegmentDownloaders: dict[int, SegmentDownloader] = {}
+
+    def add(self, segmentDownloader: SegmentDownloader) -> None:
+        sequence = segmentDownloader.segment.sequence
+        self._sequences.append(sequence)
+        self._segmentDownloaders[sequence] = segmentDownloader
+        if not segmentDownloader.isFinished():
+            self._pendingSegmentDownloaders[sequence] = segmentDownloader
+
+    def get(self, sequence: int) -> SegmentDownloader | None:
+        return self._segmentDownloaders.get(sequence)
+
+    def setFinished(self, segmentDownloader: SegmentDownloader) -> None:
+        self._pendingSegmentDownloaders.pop(segmentDownloader.segment.sequence, None)
+
+    def getHead(self) -> SegmentDownloader | None:
+        return None if len(self._sequences) == 0 else self._segmentDownloaders[self._sequences[0]]
+
+    def isHead(self, segmentDownloader: SegmentDownloader) -> bool:
+        return len(self._sequences) != 0 and self._sequences[0] == segmentDownloader.segment.sequence
+
+    def isHeadFinished(self) -> bool:
+        return len(self._sequences) != 0 and self._segmentDownloaders[self._sequences[0]].isFinished()
+
+    def popHead(self) -> SegmentDownloader:
+        sequence = self._sequences.popleft()
+        self._pendingSegmentDownloaders.pop(sequence, None)
+        return self._segmentDownloaders.pop(sequence)
+
+    def getPendingSegmentDownloaders(self) -> list[SegmentDownloader]:
+        return list(self._pendingSegmentDownloaders.values())
+
+    def getPendingCount(self) -> int:
+        return len(self._pendingSegmentDownloaders)
+
+    def getSegments(self) -> list[Segment]:
+        return [self._segmentDownloaders[sequence].segment for sequence in self._sequences]
+
+    def __len__(self):
+        return len(self._sequences)
+
+    def __contains__(self, sequence: int):
+        return sequence in self._segmentDownloaders
\ No newline at end of file
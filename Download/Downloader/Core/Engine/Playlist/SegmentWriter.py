@@ -0,0 +1,220 @@
+from .SegmentMerger import SegmentMerger
+from ..FFmpeg.FFmpeg import FFmpeg
+
+from Core.GlobalExceptions import Exceptions
+from Services.Utils.Utils import Utils
+from Services.Logging.Logger import Logger
+
+from PyQt6 import QtCore
+
+import collections
+import threading
+
+
+class SegmentOutput(QtCore.QObject):
+    started = QtCore.pyqtSignal()
+    segmentWritten = QtCore.pyqtSignal(int, int)
+    segmentDropped = QtCore.pyqtSignal(int)
+    errorOccurred = QtCore.pyqtSignal(Exception)
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, outputTarget: str, remux: bool, logger: Logger, cancelEvent: threading.Event, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.outputTarget = outputTarget
+        self.logger = logger
+        self._cancelEvent = cancelEvent
+        self._error: Exceptions.FileSystemError | Exceptions.ProcessError | Exceptions.UnexpectedError | None = None
+        self._closed = False
+        self._finished = False
+        self._pendingWrites: collections.deque[tuple[int, QtCore.QByteArray | str]] = collections.deque()
+        if remux:
+            self._file = None
+            self._segmentMerger = None
+            self._FFmpeg = FFmpeg(self.logger, parent=self)
+            self._FFmpeg.started.connect(self.started)
+            self._FFmpeg.finished.connect(self._FFmpegProcessFinished)
+            self._FFmpeg.inputReleased.connect(self._processWrites)
+        else:
+            self._file = QtCore.QFile(self.outputTarget, self)
+            self._segmentMerger = SegmentMerger(self._file)
+            self._FFmpeg = None
+
+    def start(self) -> None:
+        if self._FFmpeg == None:
+            if self._file.open(QtCore.QIODevice.OpenModeFlag.ReadWrite | QtCore.QIODevice.OpenModeFlag.ExistingOnly) and self._file.seek(self._file.size()):
+                self.logger.info(f"Using Merge Method: {self._segmentMerger.getMethod().value}")
+                self.started.emit()
+            else:
+                self._raiseException(Exceptions.FileSystemError(self._file))
+                self._setFinished()
+        else:
+            self._FFmpeg.start(
+                outputTarget=self.outputTarget,
+                transcode=False
+            )
+
+    def write(self, sequence: int, source: QtCore.QByteArray | str) -> None:
+        self._pendingWrites.append((sequence, source))
+        self._processWrites()
+
+    def cancel(self) -> None:
+        self._processWrites()
+
+    def _processWrites(self) -> None:
+        while len(self._pendingWrites) != 0:
+            writable = self._error == None and not self._cancelEvent.is_set()
+            if writable and self._FFmpeg != None and self._FFmpeg.isInputBlocked():
+                break
+            sequence, source = self._pendingWrites.popleft()
+            if writable and self._write(source):
+                self.segmentWritten.emit(sequence, self._getOutputByteSize())
+            else:
+                self.segmentDropped.emit(sequence)
+
+    def _write(self, source: QtCore.QByteArray | str) -> bool:
+        if isinstance(source, str):
+            file = QtCore.QFile(source)
+            if not file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
+                self._raiseException(Exceptions.FileSystemError(file))
+                return False
+            if self._FFmpeg == None:
+                succeeded = self._segmentMerger.appendFile(file)
+            else:
+                succeeded = self._FFmpeg.write(file.readAll())
+            file.close()
+        elif self._FFmpeg == None:
+            succeeded = self._segmentMerger.appendData(source)
+        else:
+            succeeded = self._FFmpeg.write(source)
+        if not succeeded:
+            if self._FFmpeg == None:
+                self.logger.warning("Unable to write data to file.")
+                self._raiseException(Exceptions.FileSystemError(self._file))
+            else:
+                self.logger.warning("Unable to write data to pipe.")
+                self._raiseException(Exceptions.UnexpectedError())
+        return succeeded
+
+    def _getOutputByteSize(self) -> int:
+        if self._FFmpeg == None:
+            return self._file.size()
+        else:
+            return QtCore.QFileInfo(self.outputTarget).size()
+
+    def close(self, terminate: bool) -> None:
+        if self._closed or self._finished:
+            return
+        self._closed = True
+        if self._FFmpeg == None:
+            if self._segmentMerger.getByteSize() != 0:
+                self.logger.info(f"Merged {Utils.formatByteSize(self._segmentMerger.getByteSize())} in {self._segmentMerger.getElapsedSeconds():.2f}s ({Utils.formatByteSize(self._segmentMerger.getThroughput())}/s) using {self._segmentMerger.getMethod().value}.")
+            self._file.close()
+            self._setFinished()
+        elif not self._FFmpeg.isRunning():
+            self._setFinished()
+        elif terminate:
+            self._FFmpeg.terminate()
+        else:
+            self._FFmpeg.closeStream()
+
+    def _FFmpegProcessFinished(self) -> None:
+        exception = self._FFmpeg.getError()
+        if exception != None:
+            self._raiseException(exception)
+        self._processWrites()
+        self._setFinished()
+
+    def _raiseException(self, exception: Exceptions.FileSystemError | Exceptions.ProcessError | Exceptions.UnexpectedError) -> None:
+        if self._error == None:
+            self._error = exception
+            self.errorOccurred.emit(exception)
+
+    def _setFinished(self) -> None:
+        if not self._finished:
+            self._finished = True
+            self.finished.emit()
+
+
+class SegmentWriter(QtCore.QThread):
+    outputStarted = QtCore.pyqtSignal()
+    segmentWritten = QtCore.pyqtSignal(int, int)
+    segmentDropped = QtCore.pyqtSignal(int)
+    errorOccurred = QtCore.pyqtSignal(Exception)
+    outputFinished = QtCore.pyqtSignal()
+    _writeRequested = QtCore.pyqtSignal(int, object)
+    _closeRequested = QtCore.pyqtSignal(bool)
+    _cancelRequested = QtCore.pyqtSignal()
+
+    def __init__(self, outputTarget: str, remux: bool, logger: Logger, maxQueueSize: int, parent: QtCore.QObject | None = None):
+        super().__init__(parent=parent)
+        self.outputTarget = outputTarget
+        self.logger = logger
+        self._remux = remux
+        self._maxQueueSize = maxQueueSize
+        self._queueSize = 0
+        self._cancelEvent = threading.Event()
+        self._outputStarted = False
+        self._outputFinished = False
+        self._pendingClose: bool | None = None
+
+    def run(self) -> None:
+        output = SegmentOutput(self.outputTarget, self._remux, self.logger, self._cancelEvent)
+        output.started.connect(self._outputStartedHandler)
+        output.segmentWritten.connect(self._segmentWrittenHandler)
+        output.segmentDropped.connect(self._segmentDroppedHandler)
+        output.errorOccurred.connect(self._errorOccurredHandler)
+        output.finished.connect(self._outputFinishedHandler)
+        self._writeRequested.connect(output.write)
+        self._closeRequested.connect(output.close)
+        self._cancelRequested.connect(output.cancel)
+        output.start()
+        self.exec()
+        output.deleteLater()
+
+    def write(self, sequence: int, source: QtCore.QByteArray | str) -> None:
+        self._queueSize += 1
+        self._writeRequested.emit(sequence, source)
+
+    def isFull(self) -> bool:
+        return self._queueSize >= self._maxQueueSize
+
+    def cancel(self) -> None:
+        self._cancelEvent.set()
+        self._cancelRequested.emit()
+
+    def closeOutput(self) -> None:
+        self._requestClose(False)
+
+    def terminateOutput(self) -> None:
+        self._requestClose(True)
+
+    def isOutputFinished(self) -> bool:
+        return self._outputFinished
+
+    def _requestClose(self, terminate: bool) -> None:
+        if self._outputStarted:
+            self._closeRequested.emit(terminate)
+        else:
+            self._pendingClose = terminate
+
+    def _outputStartedHandler(self) -> None:
+        self._outputStarted = True
+        self.outputStarted.emit()
+        if self._pendingClose != None:
+            self._closeRequested.emit(self._pendingClose)
+
+    def _segmentWrittenHandler(self, sequence: int, byteSize: int) -> None:
+        self._queueSize -= 1
+        self.segmentWritten.emit(sequence, byteSize)
+
+    def _segmentDroppedHandler(self, sequence: int) -> None:
+        self._queueSize -= 1
+        self.segmentDropped.emit(sequence)
+
+    def _errorOccurredHandler(self, exception: Exception) -> None:
+        self.errorOccurred.emit(exception)
+
+    def _outputFinishedHandler(self) -> None:
+        self._outputFinished = True
+        self.quit()
+        self.outputFinished.emit()
\ No newline at end of file
@@ -1,5 +1,117 @@
+from .Config import Config
 from .Playlist.PlaylistEngine import PlaylistEngine
+from .Playlist.SegmentDownloader import SegmentDownloader
+
+from Core import App
+from Core.GlobalExceptions import Exceptions
+from Services.Utils.Utils import Utils
+from Services.Logging.Logger import Logger
+from Services.Playlist.Segment import Segment
+from Download.DownloadInfo import DownloadInfo
+from Download.Downloader.Core.Engine import Modules
+
+from PyQt6 import QtCore
 
 
 class StreamEngine(PlaylistEngine):
-    pass
\ No newline at end of file
+    def __init__(self, downloadInfo: DownloadInfo, status: Modules.Status, progress: Modules.Progress, logger: Logger, parent: QtCore.QObject | None = None):
+        super().__init__(downloadInfo, status, progress, logger, parent=parent)
+        self._prefetchSegmentDownloaders: dict[int, SegmentDownloader] = {}
+        self._adoptedSegmentDownloaders: list[SegmentDownloader] = []
+        self._droppedSegmentDownloaders: list[SegmentDownloader] = []
+
+    def _playlistUpdated(self) -> None:
+        super()._playlistUpdated()
+        if self.status.terminateState.isFalse():
+            self._prefetchSegments()
+            self._updateLiveLag()
+
+    def _getSegmentDeadline(self, segment: Segment) -> int:
+        segments = self._playlistManager.playlist.getSegments()
+        if len(segments) == 0:
+            windowMilliseconds = segment.endsAt
+        elif segment.datetime != None and segment.datetime.isValid() and segments[0].datetime != None and segments[0].datetime.isValid():
+            windowMilliseconds = segments[0].datetime.msecsTo(segment.datetime) + segment.totalMilliseconds
+        else:
+            windowMilliseconds = segment.endsAt - segments[0].startsAt
+        return QtCore.QDateTime.currentMSecsSinceEpoch() + max(windowMilliseconds, 0)
+
+    def _prefetchSegments(self) -> None:
+        prefetchSegments = {segment.sequence: segment for segment in self._playlistManager.playlist.getPrefetchSegments() if segment.sequence >= self._playlistManager.getNextSequence()} if Config.STREAM_SEGMENT_PREFETCH_ENABLED else {}
+        for sequence in list(self._prefetchSegmentDownloaders):
+            if sequence not in prefetchSegments or self._prefetchSegmentDownloaders[sequence].url != prefetchSegments[sequence].url:
+                self._dropPrefetchSegmentDownloader(self._prefetchSegmentDownloaders.pop(sequence))
+        segmentDownloaders = []
+        for segment in prefetchSegments.values():
+            if segment.sequence not in self._prefetchSegmentDownloaders:
+                segmentDownloader = SegmentDownloader(
+                    self._networkAccessManager,
+                    segment,
+                    Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.prefetch.ts"),
+                    priority=self.downloadInfo.getPriority(),
+                    spooled=Config.SEGMENT_SPOOL_ENABLED,
+                    segmentSpool=self._segmentSpool,
+                    parent=self
+                )
+                segmentDownloader.setDeadline(self._getSegmentDeadline(segment))
+                segmentDownloader.finished.connect(self._prefetchSegmentDownloadFinished)
+                self._prefetchSegmentDownloaders[segment.sequence] = segmentDownloader
+                segmentDownloaders.append(segmentDownloader)
+        App.FileDownloadManager.startDownloads(segmentDownloaders)
+
+    def _dropPrefetchSegmentDownloader(self, segmentDownloader: SegmentDownloader) -> None:
+        if segmentDownloader.isFinished():
+            segmentDownloader.finished.disconnect(self._prefetchSegmentDownloadFinished)
+            segmentDownloader.discard()
+            segmentDownloader.setParent(None)
+        else:
+            self._droppedSegmentDownloaders.append(segmentDownloader)
+            App.FileDownloadManager.cancelDownload(segmentDownloader)
+
+    def _prefetchSegmentDownloadFinished(self, segmentDownloader: SegmentDownloader) -> None:
+        if segmentDownloader in self._droppedSegmentDownloaders:
+            self._droppedSegmentDownloaders.remove(segmentDownloader)
+            self._dropPrefetchSegmentDownloader(segmentDownloader)
+            self._checkDone()
+
+    def _downloadSegments(self, segments: list[Segment]) -> None:
+        super()._downloadSegments(segments)
+        adoptedSegmentDownloaders = self._adoptedSegmentDownloaders
+        self._adoptedSegmentDownloaders = []
+        for segmentDownloader in adoptedSegmentDownloaders:
+            if segmentDownloader.isFinished():
+                self._segmentDownloadFinished(segmentDownloader)
+
+    def _isSegmentDownloadRequired(self, segmentDownloader: SegmentDownloader) -> bool:
+        return super()._isSegmentDownloadRequired(segmentDownloader) and segmentDownloader not in self._adoptedSegmentDownloaders
+
+    def _createSegmentDownloader(self, segment: Segment) -> SegmentDownloader:
+        segmentDownloader = self._prefetchSegmentDownloaders.pop(segment.sequence, None)
+        if segmentDownloader != None:
+            if segmentDownloader.url == segment.url and segmentDownloader.getError() == None:
+                segmentDownloader.finished.disconnect(self._prefetchSegmentDownloadFinished)
+                segmentDownloader.segment = segment
+                self._adoptedSegmentDownloaders.append(segmentDownloader)
+                return segmentDownloader
+            self._dropPrefetchSegmentDownloader(segmentDownloader)
+        segmentDownloader = super()._createSegmentDownloader(segment)
+        segmentDownloader.setDeadline(self._getSegmentDeadline(segment))
+        return segmentDownloader
+
+    def _segmentWritten(self, sequence: int, byteSize: int) -> None:
+        super()._segmentWritten(sequence, byteSize)
+        self._updateLiveLag()
+
+    def _updateLiveLag(self) -> None:
+        if self.progress.files != 0:
+            self.status.setLiveLagMilliseconds(max(self.progress.totalMilliseconds - self.progress.skippedMilliseconds - self.progress.missingMilliseconds - self.progress.milliseconds, 0))
+            self._syncStatus()
+
+    def _checkDone(self) -> None:
+        if len(self._droppedSegmentDownloaders) == 0:
+            super()._checkDone()
+
+    def _raiseException(self, exception: Exceptions.AbortRequested | Exceptions.FileSystemError | Exceptions.NetworkError | Exceptions.ProcessError | Exceptions.UnexpectedError) -> None:
+        for sequence in list(self._prefetchSegmentDownloaders):
+            self._dropPrefetchSegmentDownloader(self._prefetchSegmentDownloaders.pop(sequence))
+        super()._raiseException(exception)
\ No newline at end of file
@@ -1,13 +1,17 @@
 from .Config import Config
 from .Playlist.PlaylistEngine import PlaylistEngine
+from .Playlist.RefreshScheduler import RefreshScheduler
 from .Playlist.SegmentDownloader import SegmentDownloader
 from .Playlist.MutableSegmentDownloader import MutableSegmentDownloader
+from .Playlist.MuteMap import MuteMap
+from .Playlist.DownloadManifest import DownloadManifest
 
 from Core import App
 from Core.GlobalExceptions import Exceptions
 from Services.Utils.Utils import Utils
 from Services.Logging.Logger import Logger
 from Services.Playlist.Segment import Segment
+from Services.Temp.TempManager import SafeTempDirectory
 from Download.DownloadInfo import DownloadInfo
 from Download.Downloader.Core.Engine import Modules
 
@@ -18,8 +22,62 @@ class VideoEngine(PlaylistEngine):
     def __init__(self, downloadInfo: DownloadInfo, status: Modules.Status, progress: Modules.Progress, logger: Logger, parent: QtCore.QObject | None = None):
         super().__init__(downloadInfo, status, progress, logger, parent=parent)
         self._playlistManager.setRange(*self.downloadInfo.getCropRangeMilliseconds())
-        self._refreshTimer.setInterval(Config.UPDATE_TRACK_INTERVAL)
+        self._refreshScheduler = RefreshScheduler(Config.UPDATE_TRACK_INTERVAL, Config.UPDATE_TRACK_INTERVAL, Config.UPDATE_TRACK_MAX_INTERVAL)
+        self._updateTrackIntervals = self._refreshScheduler.getBackOffIntervals(Config.UPDATE_TRACK_MAX_WAITING_TIME)
+        self.status.setMaxWaitingCount(len(self._updateTrackIntervals) - 1)
         self._pausedSegments: list[Segment] = []
+        self._manifest: DownloadManifest | None = None
+        self._restoredSegments: set[int] = set()
+        self._muteMap = MuteMap()
+        self._manifestTimer = QtCore.QTimer(parent=self)
+        self._manifestTimer.setSingleShot(True)
+        self._manifestTimer.setInterval(Config.DOWNLOAD_MANIFEST_SAVE_INTERVAL)
+        self._manifestTimer.timeout.connect(self._saveManifest)
+
+    def _openFile(self) -> None:
+        self.file.open(QtCore.QIODevice.OpenModeFlag.ReadWrite)
+
+    def _createTempDirectory(self) -> SafeTempDirectory:
+        resumedSafeTempDirectory = None
+        for path in SafeTempDirectory.findResumableDirectories(self.downloadInfo.directory):
+            manifest = DownloadManifest(SafeTempDirectory.getDirectoryManifestPath(path))
+            if not manifest.load() or manifest.fileName != self.downloadInfo.getAbsoluteFileName():
+                continue
+            if resumedSafeTempDirectory == None and self.downloadInfo.isResumeEnabled() and manifest.isResumable(self.downloadInfo):
+                safeTempDirectory = SafeTempDirectory(self.downloadInfo.directory, resumePath=path, parent=self)
+                if safeTempDirectory.getError() == None and self.file.resize(manifest.byteSize):
+                    self.logger.info(f"Resuming Download: <Sequence: {manifest.sequence} / Byte Size: {manifest.byteSize} / Restorable Segments: {len(manifest.segments)}>")
+                    self._manifest = manifest
+                    self._restoredSegments = set(manifest.segments)
+                    self.progress.byteSize = manifest.byteSize
+                    self.progress.totalByteSize = self.progress.byteSize
+                    resumedSafeTempDirectory = safeTempDirectory
+                    continue
+            self.logger.info(f"Removing stale temp directory: {path}")
+            QtCore.QDir(path).removeRecursively()
+        if resumedSafeTempDirectory != None:
+            return resumedSafeTempDirectory
+        self.file.resize(0)
+        safeTempDirectory = super()._createTempDirectory()
+        if safeTempDirectory.getError() == None and not self.downloadInfo.isRemuxEnabled():
+            self._manifest = DownloadManifest(safeTempDirectory.getManifestPath())
+            self._manifest.setup(self.downloadInfo)
+            self._saveManifest()
+        return safeTempDirectory
+
+    def _finish(self) -> None:
+        self._manifestTimer.stop()
+        super()._finish()
+
+    def _saveManifest(self) -> None:
+        if self._manifest != None:
+            self._manifest.segmentRange = self.downloadInfo.getCropRangeMilliseconds()
+            if not self._manifest.save():
+                self.logger.warning("Unable to save download manifest.")
+
+    def _scheduleManifestSave(self) -> None:
+        if self._manifest != None and not self.status.isDone() and not self._manifestTimer.isActive():
+            self._manifestTimer.start()
 
     def _updatePlaylist(self) -> None:
         self.status.setNextUpdateDateTime(None)
@@ -32,7 +90,6 @@ class VideoEngine(PlaylistEngine):
             self.downloadInfo.setCropRangeMilliseconds(*self._playlistManager.getSegmentRange())
             if self.downloadInfo.isUpdateTrackEnabled():
                 if self._playlistManager.hasNewSegments() or self.status.getWaitingCount() < self.status.getMaxWaitingCount():
-                    self.status.setNextUpdateDateTime(QtCore.QDateTime.currentDateTimeUtc().addMSecs(Config.UPDATE_TRACK_INTERVAL))
                     if self._playlistManager.hasNewSegments():
                         self.status.setWaitingCount(0)
                     else:
@@ -43,26 +100,80 @@ class VideoEngine(PlaylistEngine):
                 self._syncStatus()
             super()._playlistUpdated()
 
+    def _scheduleRefresh(self, changed: bool) -> None:
+        super()._scheduleRefresh(changed)
+        self.status.setNextUpdateDateTime(QtCore.QDateTime.currentDateTimeUtc().addMSecs(self.status.getRefreshInterval()))
+        self._syncStatus()
+
+    def _getRefreshInterval(self, changed: bool) -> int:
+        return self._updateTrackIntervals[min(max(self.status.getWaitingCount(), 0), len(self._updateTrackIntervals) - 1)]
+
+    def _downloadSegments(self, segments: list[Segment]) -> None:
+        segmentsToDownload = []
+        for segment in segments:
+            if self._manifest != None and self._manifest.sequence != None and segment.sequence <= self._manifest.sequence:
+                self.progress.files += 1
+                self.progress.milliseconds += segment.totalMilliseconds
+            else:
+                segmentsToDownload.append(segment)
+        super()._downloadSegments(segmentsToDownload)
+        if self._segmentTracker.isHeadFinished():
+            self._processSegments()
+
     def _createSegmentDownloader(self, segment: Segment) -> SegmentDownloader:
-        return (MutableSegmentDownloader if self.downloadInfo.isUnmuteVideoEnabled() else SegmentDownloader)(
-            self._networkAccessManager,
-            segment,
-            Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.ts"),
-            priority=self.downloadInfo.getPriority(),
-            parent=self
-        )
+        if self.downloadInfo.isUnmuteVideoEnabled():
+            segmentDownloader = MutableSegmentDownloader(
+                self._networkAccessManager,
+                segment,
+                Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.ts"),
+                priority=self.downloadInfo.getPriority(),
+                spooled=Config.SEGMENT_SPOOL_ENABLED,
+                segmentSpool=self._segmentSpool,
+                muteMap=self._muteMap,
+                parent=self
+            )
+        else:
+            segmentDownloader = SegmentDownloader(
+                self._networkAccessManager,
+                segment,
+                Utils.joinPath(self._safeTempDirectory.path(), f"{segment.sequence}.ts"),
+                priority=self.downloadInfo.getPriority(),
+                spooled=Config.SEGMENT_SPOOL_ENABLED,
+                segmentSpool=self._segmentSpool,
+                parent=self
+            )
+        if segment.sequence in self._restoredSegments:
+            self._restoredSegments.discard(segment.sequence)
+            if segmentDownloader.restore():
+                self.logger.info(f"Restored Segment: <Sequence: {segment.sequence} / Length: {segment.totalMilliseconds}>")
+        return segmentDownloader
 
     def _segmentDownloadFinished(self, segmentDownloader: SegmentDownloader) -> None:
+        super()._segmentDownloadFinished(segmentDownloader)
+        if self._manifest != None and segmentDownloader.getError() == None and not segmentDownloader.isSpooled() and segmentDownloader.file.exists():
+            self._manifest.segments.add(segmentDownloader.segment.sequence)
+            self._scheduleManifestSave()
+
+    def _discardSegment(self, segmentDownloader: SegmentDownloader) -> None:
+        if self._manifest != None:
+            self._manifest.segments.discard(segmentDownloader.segment.sequence)
+        super()._discardSegment(segmentDownloader)
+
+    def _segmentWritten(self, sequence: int, byteSize: int) -> None:
+        if self._manifest != None:
+            self._manifest.setMerged(sequence, byteSize)
+            self._scheduleManifestSave()
+        super()._segmentWritten(sequence, byteSize)
+
+    def _processSegments(self) -> None:
         if self.status.pauseState.isProcessing():
-            while len(self._segmentDownloaders) > 0 and self._segmentDownloaders[0].isFinished():
-                nextSegmentDownloader = self._segmentDownloaders.pop(0)
-                nextSegmentDownloader.file.remove()
-                nextSegmentDownloader.setParent(None)
-            if len(self._segmentDownloaders) == 0:
+            while self._segmentTracker.isHeadFinished():
+                self._discardSegment(self._segmentTracker.popHead())
+            if len(self._segmentTracker) == 0:
                 self.status.pauseState.setTrue()
                 self._syncStatus()
         else:
-            super()._segmentDownloadFinished(segmentDownloader)
+            super()._processSegments()
 
     def _mergeSegment(self, segmentDownloader: SegmentDownloader) -> None:
         if isinstance(segmentDownloader, MutableSegmentDownloader):
@@ -82,12 +193,11 @@ class VideoEngine(PlaylistEngine):
             self._syncStatus()
             if self._refreshTimer.isActive():
                 self._refreshTimer.stop()
-            self._pausedSegments = [segmentDownloader.segment for segmentDownloader in self._segmentDownloaders]
-            if len(self._segmentDownloaders) == 0:
-                self.status.pauseState.setTrue()
-                self._syncStatus()
+            self._pausedSegments = self._segmentTracker.getSegments()
+            if self._segmentTracker.getPendingCount() == 0:
+                self._processSegments()
             else:
-                App.FileDownloadManager.cancelDownloads(self._segmentDownloaders)
+                App.FileDownloadManager.cancelDownloads(self._segmentTracker.getPendingSegmentDownloaders())
 
     def resume(self) -> None:
         if self.status.pauseState.isTrue():
@@ -0,0 +1,76 @@
+from .PriorityQueue import PriorityQueue
+
+import collections
+import typing
+
+
+class FairQueue:
+    def __init__(self):
+        self._queues: dict[typing.Hashable, PriorityQueue] = {}
+        self._weights: dict[typing.Hashable, int] = {}
+        self._deficits: dict[typing.Hashable, int] = {}
+        self._groups: collections.deque[typing.Hashable] = collections.deque()
+        self._itemGroups: dict[typing.Any, typing.Hashable] = {}
+        self._deadlineQueue = PriorityQueue()
+        self._deadlines: dict[typing.Any, int] = {}
+
+    def push(self, item: typing.Any, priority: int = 0, group: typing.Hashable = None, weight: int = 1, deadline: int | None = None) -> None:
+        if item in self:
+            self.removeItem(item)
+        if deadline != None:
+            self._deadlineQueue.push(item, priority=-deadline)
+            self._deadlines[item] = deadline
+            return
+        if group not in self._queues:
+            self._queues[group] = PriorityQueue()
+            self._deficits[group] = 0
+            self._groups.append(group)
+        self._weights[group] = max(weight, 1)
+        self._queues[group].push(item, priority=priority)
+        self._itemGroups[item] = group
+
+    def pop(self) -> typing.Any:
+        if len(self._deadlineQueue) != 0:
+            item = self._deadlineQueue.pop()
+            del self._deadlines[item]
+            return item
+        group = self._groups[0]
+        if self._deficits[group] < 1:
+            self._deficits[group] += self._weights[group]
+        item = self._queues[group].pop()
+        del self._itemGroups[item]
+        self._deficits[group] -= 1
+        if len(self._queues[group]) == 0:
+            self._removeGroup(group)
+        elif self._deficits[group] < 1:
+            self._groups.rotate(-1)
+        return item
+
+    def getEarliestDeadline(self) -> int | None:
+        return None if len(self._deadlineQueue) == 0 else self._deadlines[self._deadlineQueue.peek()]
+
+    def removeItem(self, item: typing.Any) -> None:
+        if item in self._deadlines:
+            self._deadlineQueue.removeItem(item)
+            del self._deadlines[item]
+            return
+        group = self._itemGroups.pop(item)
+        self._queues[group].removeItem(item)
+        if len(self._queues[group]) == 0:
+            self._removeGroup(group)
+
+    def removeItems(self, items: typing.Iterable[typing.Any]) -> None:
+        for item in items:
+            self.removeItem(item)
+
+    def _removeGroup(self, group: typing.Hashable) -> None:
+        self._groups.remove(group)
+        del self._queues[group]
+        del self._weights[group]
+        del self._deficits[group]
+
+    def __len__(self):
+        return len(self._itemGroups) + len(self._deadlines)
+
+    def __contains__(self, item):
+        return item in self._itemGroups or item in self._deadlines
\ No newline at end of file
@@ -3,6 +3,7 @@ from .Segment import Segment
 
 from PyQt6 import QtCore
 
+import bisect
 import typing
 
 
@@ -13,11 +14,20 @@ class Exceptions:
 
 
 class Playlist:
+    PARSED_TAGS = ("EXT-X-VERSION", "EXT-X-TARGETDURATION", "EXT-X-MEDIA-SEQUENCE", "EXT-X-SERVER-CONTROL", "EXT-X-SKIP")
+
     def __init__(self):
         self._version: int = 3
         self._targetDuration: int = 0
         self._endList = False
+        self._skipUntil: float = 0
+        self._blockReload = False
         self._segments: list[Segment] = []
+        self._prefetchSegments: list[Segment] = []
+        self._segmentLines: list[str] = []
+        self._sequences: list[int] = []
+        self._startsAt: list[int] = []
+        self._endsAt: list[int] = []
 
     def setVersion(self, version: int) -> None:
         self._version = version
@@ -40,12 +50,28 @@ class Playlist:
     def isEndList(self) -> bool:
         return self._endList
 
+    def getNextSequence(self) -> int:
+        return 0 if len(self._segments) == 0 else self._segments[-1].sequence + 1
+
+    def getSkipUntil(self) -> float:
+        return self._skipUntil
+
+    def canBlockReload(self) -> bool:
+        return self._blockReload
+
     def setSegments(self, segments: list[Segment]) -> None:
         self._segments = segments
+        self._segmentLines = []
+        self._sequences = [segment.sequence for segment in segments]
+        self._startsAt = [segment.startsAt for segment in segments]
+        self._endsAt = [segment.endsAt for segment in segments]
 
     def getSegments(self) -> list[Segment]:
         return self._segments
 
+    def getPrefetchSegments(self) -> list[Segment]:
+        return self._prefetchSegments
+
     @property
     def totalMilliseconds(self) -> int:
         return 0 if len(self._segments) == 0 else self._segments[-1].endsAt
@@ -54,19 +80,30 @@ class Playlist:
     def totalSeconds(self) -> float:
         return self.totalMilliseconds / 1000
 
-    def loads(self, text: str, baseUrl: QtCore.QUrl | None = None) -> None:
+    def loads(self, text: str, baseUrl: QtCore.QUrl | None = None, incremental: bool = False) -> None:
         try:
             lines = text.splitlines()
             version = 3
             targetDuration = 0
             mediaSequence = 0
             endList = False
+            skipUntil = 0
+            blockReload = False
             segments = []
+            prefetchLines = []
+            segmentLines = []
             expectSegment = []
-            elapsedMilliseconds = 0
+            elapsedMilliseconds = None
+            knownSequence = self.getMediaSequence() if incremental and len(self._segments) != 0 and len(self._segmentLines) == len(self._segments) else None
             assert PlaylistTagReader.getTag(lines[0]) == PlaylistTag("EXTM3U")
             for line in lines:
-                tag = PlaylistTagReader.getTag(line)
+                if line.startswith("#EXTINF:") or line.startswith("#EXT-X-PROGRAM-DATE-TIME:"):
+                    expectSegment.append(line)
+                    continue
+                elif line.startswith("#EXT-X-TWITCH-PREFETCH:"):
+                    prefetchLines.append(line.split(":", 1)[1])
+                    continue
+                tag = PlaylistTagReader.getTag(line, names=self.PARSED_TAGS)
                 if tag != None:
                     if tag.name == "EXT-X-VERSION":
                         version = int(tag.data[0])
@@ -76,24 +113,33 @@ class Playlist:
                         mediaSequence = int(tag.data[0])
                     elif tag.name == "EXT-X-ENDLIST":
                         endList = True
-                    elif tag.name == "EXT-X-PROGRAM-DATE-TIME":
-                        expectSegment.append(tag)
-                    elif tag.name == "EXTINF":
-                        expectSegment.append(tag)
+                    elif tag.name == "EXT-X-SERVER-CONTROL":
+                        skipUntil = float(tag.data.get("CAN-SKIP-UNTIL", 0))
+                        blockReload = tag.data.get("CAN-BLOCK-RELOAD") == "YES"
+                    elif tag.name == "EXT-X-SKIP":
+                        for sequence in range(mediaSequence, mediaSequence + int(tag.data["SKIPPED-SEGMENTS"])):
+                            index = sequence - knownSequence
+                            assert 0 <= index < len(self._segments)
+                            if elapsedMilliseconds == None:
+                                elapsedMilliseconds = self._segments[index].startsAt
+                            segments.append(self._segments[index])
+                            segmentLines.append(self._segmentLines[index])
+                            elapsedMilliseconds += self._segments[index].totalMilliseconds
                     elif tag.name == "EXT-X-DISCONTINUITY":
                         pass
                 elif len(expectSegment) != 0:
-                    programDateTime = None
-                    durationMilliseconds = None
-                    for tag in expectSegment:
-                        if tag.name == "EXT-X-PROGRAM-DATE-TIME":
-                            programDateTime = QtCore.QDateTime.fromString(tag.data[0], QtCore.Qt.DateFormat.ISODateWithMs)
-                        elif tag.name == "EXTINF":
-                            durationMilliseconds = int(float(tag.data[0]) * 1000)
-                    if durationMilliseconds == None:
-                        continue
-                    segments.append(Segment(mediaSequence + len(segments), QtCore.QUrl(line) if baseUrl == None else baseUrl.resolved(QtCore.QUrl(line)), programDateTime, durationMilliseconds, elapsedMilliseconds, tag.data[1]))
-                    elapsedMilliseconds += durationMilliseconds
+                    sequence = mediaSequence + len(segments)
+                    segmentLine = "\n".join((*expectSegment, line))
+                    segment = self._getKnownSegment(knownSequence, sequence, segmentLine)
+                    if elapsedMilliseconds == None:
+                        elapsedMilliseconds = 0 if segment == None else segment.startsAt
+                    if segment == None or segment.startsAt != elapsedMilliseconds:
+                        segment = self._createSegment(sequence, line, expectSegment, elapsedMilliseconds, baseUrl)
+                        if segment == None:
+                            continue
+                    segments.append(segment)
+                    segmentLines.append(segmentLine)
+                    elapsedMilliseconds += segment.totalMilliseconds
                     expectSegment.clear()
         except:
             raise Exceptions.InvalidPlaylist
@@ -101,30 +147,56 @@ class Playlist:
             self.setVersion(version)
             self.setTargetDuration(targetDuration)
             self.setEndList(endList)
+            self._skipUntil = skipUntil
+            self._blockReload = blockReload
             self.setSegments(segments)
+            self._segmentLines = segmentLines
+            self._prefetchSegments = [Segment(mediaSequence + len(segments) + index, line, None, 0, self.totalMilliseconds, baseUrl=baseUrl) for index, line in enumerate(prefetchLines)]
+
+    def _getKnownSegment(self, knownSequence: int | None, sequence: int, line: str) -> Segment | None:
+        if knownSequence == None:
+            return None
+        index = sequence - knownSequence
+        if 0 <= index < len(self._segments) and self._segmentLines[index] == line:
+            return self._segments[index]
+        return None
+
+    def _createSegment(self, sequence: int, line: str, tagLines: list[str], elapsedMilliseconds: int, baseUrl: QtCore.QUrl | None) -> Segment | None:
+        programDateTime = None
+        durationMilliseconds = None
+        title = ""
+        for tag in map(PlaylistTagReader.getTag, tagLines):
+            if tag.name == "EXT-X-PROGRAM-DATE-TIME":
+                programDateTime = tag.data[0]
+            elif tag.name == "EXTINF":
+                durationMilliseconds = int(float(tag.data[0]) * 1000)
+                title = tag.data[1]
+        if durationMilliseconds == None:
+            return None
+        return Segment(sequence, line, programDateTime, durationMilliseconds, elapsedMilliseconds, title, baseUrl=baseUrl)
 
     def getSegmentRange(self, mSecsFrom: int | None = None, mSecsTo: int | None = None) -> tuple[int | None, int | None]:
         if mSecsFrom != None:
             if mSecsFrom > self.totalMilliseconds:
                 mSecsFrom = self.totalMilliseconds
             else:
-                for segment in self._segments:
-                    if segment.endsAt > mSecsFrom:
-                        mSecsFrom = segment.startsAt
-                        break
+                index = bisect.bisect_right(self._endsAt, mSecsFrom)
+                if index < len(self._segments):
+                    mSecsFrom = self._startsAt[index]
         if mSecsTo != None:
             if mSecsTo > self.totalMilliseconds:
                 mSecsTo = self.totalMilliseconds
             else:
-                for segment in reversed(self._segments):
-                    if segment.startsAt < mSecsTo:
-                        mSecsTo = segment.endsAt
-                        break
+                index = bisect.bisect_left(self._startsAt, mSecsTo)
+                if index > 0:
+                    mSecsTo = self._endsAt[index - 1]
         return mSecsFrom, mSecsTo
 
-    def getRangedSegments(self, mSecsFrom: int | None = None, mSecsTo: int | None = None) -> typing.Generator[Segment, None, None]:
+    def getRangedSegments(self, mSecsFrom: int | None = None, mSecsTo: int | None = None, sequence: int | None = None) -> typing.Generator[Segment, None, None]:
         mSecsFrom = mSecsFrom or 0
         mSecsTo = mSecsTo or self.totalMilliseconds
-        for segment in self.getSegments():
-            if segment.startsAt < mSecsTo and segment.endsAt > mSecsFrom:
-                yield segment
\ No newline at end of file
+        start = bisect.bisect_right(self._endsAt, mSecsFrom)
+        if sequence != None:
+            start = max(start, bisect.bisect_left(self._sequences, sequence))
+        for index in range(start, bisect.bisect_left(self._startsAt, mSecsTo)):
+            yield self._segments[index]
\ No newline at end of file
@@ -17,8 +17,14 @@ class PlaylistManager(QtCore.QObject):
         self.playlist = Playlist.Playlist()
         self._range = (None, None)
         self._networkAccessManager = networkAccessManager
-        self._request = QtNetwork.QNetworkRequest(self.url)
-        self._request.setTransferTimeout(timeout)
+        self._timeout = timeout
+        self._entityTag: QtCore.QByteArray | None = None
+        self._lastModified: QtCore.QByteArray | None = None
+        self._loaded = False
+        self._endList = False
+        self._loadedTimer = QtCore.QElapsedTimer()
+        self._skipRequested = False
+        self._skipDisabled = False
         self._reply: QtNetwork.QNetworkReply | None = None
         self._error: Exceptions.AbortRequested | Exceptions.NetworkError | Playlist.Exceptions.InvalidPlaylist | None = None
         self._retryTimer = QtCore.QTimer(parent=self)
@@ -41,9 +47,34 @@ class PlaylistManager(QtCore.QObject):
         if self._reply == None:
             self._error = None
             self._running = True
-            self._reply = self._networkAccessManager.get(self._request)
+            self._reply = self._networkAccessManager.get(self._createRequest())
             self._reply.finished.connect(self._requestDone)
 
+    def _createRequest(self) -> QtNetwork.QNetworkRequest:
+        url = QtCore.QUrl(self.url)
+        timeout = self._timeout
+        self._skipRequested = False
+        if self._loaded and not self.playlist.isEndList():
+            query = QtCore.QUrlQuery(url)
+            if self.playlist.canBlockReload():
+                query.addQueryItem("_HLS_msn", str(self.playlist.getNextSequence()))
+                timeout = max(timeout, self.playlist.getTargetDuration() * 3000)
+            if not self._skipDisabled and self.playlist.getSkipUntil() != 0 and self._loadedTimer.elapsed() < self.playlist.getSkipUntil() * 500:
+                query.addQueryItem("_HLS_skip", "YES")
+                self._skipRequested = True
+            url.setQuery(query)
+        self._skipDisabled = False
+        request = QtNetwork.QNetworkRequest(url)
+        request.setTransferTimeout(timeout)
+        if self._entityTag != None:
+            request.setRawHeader(b"If-None-Match", self._entityTag)
+        if self._lastModified != None:
+            request.setRawHeader(b"If-Modified-Since", self._lastModified)
+        return request
+
+    def isBlockingReloadAvailable(self) -> bool:
+        return self._loaded and not self.playlist.isEndList() and self.playlist.canBlockReload()
+
     def abort(self) -> None:
         self._raiseException(Exceptions.AbortRequested())
 
@@ -57,11 +88,26 @@ class PlaylistManager(QtCore.QObject):
             return
         if reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
             self._currentNetworkError = None
+            if reply.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 304 and self._loaded:
+                self.playlist.setEndList(self._endList)
+                self._loadedTimer.start()
+                self._running = False
+                self.playlistUpdated.emit()
+                return
             try:
-                self.playlist.loads(reply.readAll().data().decode(errors="ignore"), baseUrl=self.url)
+                self.playlist.loads(reply.readAll().data().decode(errors="ignore"), baseUrl=self.url, incremental=True)
             except Exception as e:
-                self._raiseException(e)
+                if self._skipRequested:
+                    self._skipDisabled = True
+                    self._updatePlaylist()
+                else:
+                    self._raiseException(e)
             else:
+                self._entityTag = reply.rawHeader(b"ETag") if reply.hasRawHeader(b"ETag") else None
+                self._lastModified = reply.rawHeader(b"Last-Modified") if reply.hasRawHeader(b"Last-Modified") else None
+                self._endList = self.playlist.isEndList()
+                self._loaded = True
+                self._loadedTimer.start()
                 self._running = False
                 self.playlistUpdated.emit()
         elif self._currentNetworkError == QtNetwork.QNetworkReply.NetworkError.ContentAccessDenied and self._retryCount != 0:
@@ -88,17 +134,15 @@ class PlaylistManager(QtCore.QObject):
         self._updatePlaylist()
 
     def hasNewSegments(self) -> bool:
-        segments = list(self.playlist.getRangedSegments(*self._range))
-        if len(segments) == 0:
-            return False
-        else:
-            return segments[-1].sequence >= self._nextSequence
+        return next(self.playlist.getRangedSegments(*self._range, sequence=self._nextSequence), None) != None
 
     def getNewSegments(self) -> typing.Generator[Segment, None, None]:
-        for segment in self.playlist.getRangedSegments(*self._range):
-            if segment.sequence >= self._nextSequence:
-                self._nextSequence = segment.sequence + 1
-                yield segment
+        for segment in self.playlist.getRangedSegments(*self._range, sequence=self._nextSequence):
+            self._nextSequence = segment.sequence + 1
+            yield segment
+
+    def getNextSequence(self) -> int:
+        return self._nextSequence
 
     def setRange(self, trimFrom: int | None, trimTo: int | None) -> None:
         self._range = (trimFrom, trimTo)
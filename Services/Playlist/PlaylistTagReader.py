@@ -1,4 +1,4 @@
-import re
+import typing
 
 
 class PlaylistTag:
@@ -29,20 +29,17 @@ class PlaylistTag:
 
 
 class PlaylistTagReader:
-    TAG_WITH_DATA = re.compile("#(.*?):(.*)")
-    TAG_WITHOUT_DATA = re.compile("#(.*)")
-
     @classmethod
-    def getTag(self, string: str) -> PlaylistTag | None:
-        tag = re.match(self.TAG_WITH_DATA, string)
-        if tag == None:
-            tag = re.match(self.TAG_WITHOUT_DATA, string)
-            if tag == None:
-                return None
-            else:
-                return PlaylistTag(tag.group(1))
-        else:
-            return PlaylistTag(tag.group(1), self._getTagData(tag.group(2)))
+    def getTag(self, string: str, names: typing.Container[str] | None = None) -> PlaylistTag | None:
+        if not string.startswith("#"):
+            return None
+        index = string.find(":")
+        if index == -1:
+            return PlaylistTag(string[1:])
+        name = string[1:index]
+        if names != None and name not in names:
+            return PlaylistTag(name)
+        return PlaylistTag(name, self._getTagData(string[index + 1:]))
 
     @classmethod
     def _getTagData(self, line: str) -> list[str] | dict[str, str]:
@@ -59,6 +56,8 @@ class PlaylistTagReader:
     @classmethod
     def _parseListString(self, line: str) -> list[str]:
         parsedLine = line.split(",")
+        if "\'" not in line and "\"" not in line:
+            return parsedLine
         quotation = None
         data = []
         for string in parsedLine:
@@ -77,6 +76,8 @@ class PlaylistTagReader:
     @classmethod
     def _parseDictString(self, line: str) -> dict[str, str]:
         parsedLine = line.split(",")
+        if "\'" not in line and "\"" not in line:
+            return dict(string.split("=", 1) for string in parsedLine)
         quotation = None
         data = {}
         for string in parsedLine:
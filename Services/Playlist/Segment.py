@@ -1,21 +1,48 @@
 from PyQt6 import QtCore
 
+import sys
+
 
 class Segment:
-    def __init__(self, sequence: int, url: QtCore.QUrl, datetime: QtCore.QDateTime | None, totalMilliseconds: int, startsAt: int, title: str = ""):
+    __slots__ = ("sequence", "totalMilliseconds", "startsAt", "title", "_url", "_baseUrl", "_datetime")
+
+    def __init__(self, sequence: int, url: QtCore.QUrl | str, datetime: QtCore.QDateTime | str | None, totalMilliseconds: int, startsAt: int, title: str = "", baseUrl: QtCore.QUrl | None = None):
         self.sequence = sequence
-        self.url = url
-        self.datetime = datetime
         self.totalMilliseconds = totalMilliseconds
         self.startsAt = startsAt
-        self.title = title
+        self.title = sys.intern(title)
+        self._url = url
+        self._baseUrl = baseUrl
+        self._datetime = datetime
+
+    @property
+    def url(self) -> QtCore.QUrl:
+        if isinstance(self._url, str):
+            self._url = QtCore.QUrl(self._url) if self._baseUrl == None else self._baseUrl.resolved(QtCore.QUrl(self._url))
+            self._baseUrl = None
+        return self._url
+
+    @url.setter
+    def url(self, url: QtCore.QUrl) -> None:
+        self._url = url
+        self._baseUrl = None
+
+    @property
+    def datetime(self) -> QtCore.QDateTime | None:
+        if isinstance(self._datetime, str):
+            self._datetime = QtCore.QDateTime.fromString(self._datetime, QtCore.Qt.DateFormat.ISODateWithMs)
+        return self._datetime
+
+    @datetime.setter
+    def datetime(self, datetime: QtCore.QDateTime | None) -> None:
+        self._datetime = datetime
 
     @property
     def endsAt(self) -> int:
         return self.startsAt + self.totalMilliseconds
 
     def __str__(self):
-        return f"<Segment {self.__dict__}>"
+        return f"<Segment {({'sequence': self.sequence, 'url': self.url, 'datetime': self.datetime, 'totalMilliseconds': self.totalMilliseconds, 'startsAt': self.startsAt, 'title': self.title})}>"
 
     def __repr__(self):
         return self.__str__()
\ No newline at end of file
@@ -10,7 +10,7 @@ class VariantPlaylistReader(PlaylistTagReader):
         resolutions = []
         expect = False
         for line in playlist.splitlines():
-            tag = cls.getTag(line)
+            tag = cls.getTag(line, names=("EXT-X-MEDIA",))
             if tag != None:
                 if tag.name == "EXT-X-MEDIA":
                     expect = tag.data
@@ -3,30 +3,51 @@ import heapq
 
 
 class PriorityQueue:
+    _REMOVED = object()
+
     def __init__(self):
         self._data = []
+        self._entries = {}
         self._index = 0
 
     def push(self, item: typing.Any, priority: int = 0) -> None:
-        if len(self._data) == 0:
+        if item in self._entries:
+            self.removeItem(item)
+        if len(self._entries) == 0:
+            self._data.clear()
             self._index = 0
-        heapq.heappush(self._data, (-priority, self._index, item))
+        entry = [-priority, self._index, item]
+        self._entries[item] = entry
+        heapq.heappush(self._data, entry)
         self._index += 1
 
     def pop(self) -> typing.Any:
-        return heapq.heappop(self._data)[2]
+        while True:
+            item = heapq.heappop(self._data)[2]
+            if item is not self._REMOVED:
+                del self._entries[item]
+                return item
+
+    def peek(self) -> typing.Any:
+        while self._data[0][2] is self._REMOVED:
+            heapq.heappop(self._data)
+        return self._data[0][2]
+
+    def setPriority(self, item: typing.Any, priority: int) -> None:
+        self.push(item, priority=priority)
 
     def removeItem(self, item: typing.Any) -> None:
-        self._data.remove(next(queueData for queueData in self._data if queueData[2] == item))
-        heapq.heapify(self._data)
+        self._entries.pop(item)[2] = self._REMOVED
+        if len(self._data) > 2 * len(self._entries) + 64:
+            self._data = [entry for entry in self._data if entry[2] is not self._REMOVED]
+            heapq.heapify(self._data)
 
     def removeItems(self, items: typing.Iterable[typing.Any]) -> None:
         for item in items:
-            self._data.remove(next(queueData for queueData in self._data if queueData[2] == item))
-        heapq.heapify(self._data)
+            self.removeItem(item)
 
     def __len__(self):
-        return len(self._data)
+        return len(self._entries)
 
     def __contains__(self, item):
-        return any(queueData[2] == item for queueData in self._data)
\ No newline at end of file
+        return item in self._entries
\ No newline at end of file
@@ -5,4 +5,6 @@ class Config:
     DIRECTORY_PREFIX = f".{CoreConfig.APP_NAME}_"
     TEMP_LIST_DIRECTORY = _P(CoreConfig.APPDATA_PATH, "tempdirs")
     TEMP_KEY_FILE_PREFIX = f"tmp_"
-    DIRECTORY_LOCK_FILE_NAME = "Lock"
\ No newline at end of file
+    DIRECTORY_LOCK_FILE_NAME = "Lock"
+    DIRECTORY_MANIFEST_FILE_NAME = "Manifest"
+    RESUMABLE_DIRECTORY_EXPIRATION_DAYS = 7
\ No newline at end of file
@@ -6,22 +6,29 @@ from Services.Logging.Logger import Logger
 
 from PyQt6 import QtCore
 
+import json
 import os
 import uuid
 
 
 class SafeTempDirectory(QtCore.QObject):
-    def __init__(self, directory: str, parent: QtCore.QObject | None = None):
+    def __init__(self, directory: str, resumePath: str | None = None, parent: QtCore.QObject | None = None):
         super().__init__(parent=parent)
         self._error: Exceptions.FileSystemError | None = None
-        self._directory = QtCore.QDir(OSUtils.joinPath(directory, f"{Config.DIRECTORY_PREFIX}{uuid.uuid4()}"))
-        if not self._directory.mkdir(self._directory.path()):
-            self._raiseException(Exceptions.FileSystemError(self._directory))
-            return
-        try:
-            OSUtils.hideFileOrDirectory(self._directory.path())
-        except:
-            pass
+        if resumePath == None:
+            self._directory = QtCore.QDir(OSUtils.joinPath(directory, f"{Config.DIRECTORY_PREFIX}{uuid.uuid4()}"))
+            if not self._directory.mkdir(self._directory.path()):
+                self._raiseException(Exceptions.FileSystemError(self._directory))
+                return
+            try:
+                OSUtils.hideFileOrDirectory(self._directory.path())
+            except:
+                pass
+        else:
+            self._directory = QtCore.QDir(resumePath)
+            if not self._directory.exists():
+                self._raiseException(Exceptions.FileSystemError(self._directory))
+                return
         self._keyFile = QtCore.QTemporaryFile(OSUtils.joinPath(Config.TEMP_LIST_DIRECTORY, Config.TEMP_KEY_FILE_PREFIX), self)
         if not self._keyFile.open() or self._keyFile.write(self._directory.path().encode()) == -1:
             self._directory.removeRecursively()
@@ -42,6 +49,22 @@ class SafeTempDirectory(QtCore.QObject):
     def path(self) -> str:
         return self._directory.path()
 
+    def getManifestPath(self) -> str:
+        return self.getDirectoryManifestPath(self.path())
+
+    @staticmethod
+    def getDirectoryManifestPath(path: str) -> str:
+        return OSUtils.joinPath(path, Config.DIRECTORY_MANIFEST_FILE_NAME)
+
+    @classmethod
+    def findResumableDirectories(cls, directory: str) -> list[str]:
+        try:
+            fileNames = OSUtils.listDirectory(directory)
+        except:
+            return []
+        paths = [OSUtils.joinPath(directory, fileName) for fileName in fileNames if fileName.startswith(Config.DIRECTORY_PREFIX)]
+        return [path for path in paths if OSUtils.isFile(cls.getDirectoryManifestPath(path))]
+
     def clear(self):
         self._dirLock.close()
         self._dirLock.remove()
@@ -77,7 +100,24 @@ class TempManager(QtCore.QObject):
             if file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
                 tempDir = file.readAll().data().decode(errors="ignore")
                 if OSUtils.isDirectory(tempDir):
+                    if self._isResumable(tempDir):
+                        self.logger.info(f"Keeping resumable temp directory: {tempDir}")
+                        file.close()
+                        file.deleteLater()
+                        return
                     self.logger.info(f"Removing temp directory: {tempDir}")
                     OSUtils.removeDirectory(tempDir)
             file.remove()
-            file.deleteLater()
\ No newline at end of file
+            file.deleteLater()
+
+    def _isResumable(self, tempDir: str) -> bool:
+        manifestInfo = QtCore.QFileInfo(SafeTempDirectory.getDirectoryManifestPath(tempDir))
+        if not manifestInfo.isFile() or manifestInfo.lastModified().daysTo(QtCore.QDateTime.currentDateTime()) >= Config.RESUMABLE_DIRECTORY_EXPIRATION_DAYS:
+            return False
+        try:
+            with open(manifestInfo.filePath(), "rb") as file:
+                manifest = json.loads(file.read().decode())
+            targetInfo = QtCore.QFileInfo(manifest["fileName"])
+            return targetInfo.isFile() and targetInfo.size() >= manifest["byteSize"]
+        except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError):
+            return False
\ No newline at end of file
@@ -141,7 +141,10 @@ class Download(QtWidgets.QWidget):
     def _updateDurationInfo(self) -> None:
         if isinstance(self._downloader, StreamDownloader):
             self._ui.downloadInfoView.updateDurationInfo(self._downloader.progress.milliseconds)
-            self._ui.duration.setText(Utils.formatMilliseconds(self._downloader.progress.milliseconds))
+            if self._downloader.status.getLiveLagMilliseconds() == None:
+                self._ui.duration.setText(Utils.formatMilliseconds(self._downloader.progress.milliseconds))
+            else:
+                self._ui.duration.setText(f"{Utils.formatMilliseconds(self._downloader.progress.milliseconds)} ({T('#Live lag: {time}', time=Utils.formatMilliseconds(self._downloader.status.getLiveLagMilliseconds()))})")
         elif isinstance(self._downloader, VideoDownloader):
             self._ui.downloadInfoView.updateDurationInfo(
                 totalMilliseconds=int(self._downloader.downloadInfo.content.lengthSeconds * 1000),
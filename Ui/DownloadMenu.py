@@ -1,5 +1,6 @@
 from Core.Ui import *
 from Download.DownloadInfo import DownloadInfo
+from Download.Downloader.Core.Engine.Playlist.DownloadManifest import DownloadManifest
 from Services.FileNameLocker import FileNameLocker
 from Ui.Components.Utils.FileNameGenerator import FileNameGenerator
 
@@ -260,6 +261,10 @@ class DownloadMenu(QtWidgets.QDialog, WindowGeometryManager):
             Utils.info("error", "#There is another download in progress with the same file name.", parent=self)
             return False
         elif Utils.isFile(self.downloadInfo.getAbsoluteFileName()):
+            if self.downloadInfo.type.isVideo():
+                if len(DownloadManifest.findResumableDirectories(self.downloadInfo)) != 0 and Utils.ask("resume", "#An unfinished download of this file was found.\nResume the download?", okText=T("resume"), cancelText=T("overwrite"), parent=self):
+                    self.downloadInfo.setResumeEnabled(True)
+                    return True
             if not Utils.ask("overwrite", "#A file with the same name already exists.\nOverwrite?", parent=self):
                 return False
         elif not Utils.isDirectory(self.downloadInfo.directory) or Utils.isDirectory(self.downloadInfo.getAbsoluteFileName()):
@@ -268,9 +273,10 @@ class DownloadMenu(QtWidgets.QDialog, WindowGeometryManager):
         return True
 
     def accept(self) -> None:
+        if self.downloadInfo.type.isVideo():
+            self.downloadInfo.setResumeEnabled(False)
+            self.saveCropRange()
         if self.checkDownloadAvailable():
-            if self.downloadInfo.type.isVideo():
-                self.saveCropRange()
             self.downloadInfo.saveOptionHistory()
             self.downloadRequested.emit(self.downloadInfo)
             super().accept()
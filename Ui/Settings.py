@@ -68,6 +68,30 @@ class Settings(QtWidgets.QWidget):
         self._ui.speedSpinBox.setRange(DownloadEngineConfig.FILE_DOWNLOAD_MANAGER_MIN_POOL_SIZE, DownloadEngineConfig.FILE_DOWNLOAD_MANAGER_MAX_POOL_SIZE)
         self._ui.speedSpinBox.valueChanged.connect(self.setDownloadSpeed)
         self.setDownloadSpeed(App.FileDownloadManager.getPoolSize())
+        self._ui.adaptiveDownloadSpeed.setChecked(App.FileDownloadManager.isAdaptivePoolSizeEnabled())
+        self._ui.adaptiveDownloadSpeed.toggled.connect(self.setAdaptiveDownloadSpeedEnabled)
+        self._ui.speedSliderArea.setEnabled(not App.FileDownloadManager.isAdaptivePoolSizeEnabled())
+        App.FileDownloadManager.poolSizeChanged.connect(self._updateEffectiveDownloadSpeed)
+        self._updateEffectiveDownloadSpeed(App.FileDownloadManager.getEffectivePoolSize())
+        self._connectionCountTimer = QtCore.QTimer(parent=self)
+        self._connectionCountTimer.setInterval(1000)
+        self._connectionCountTimer.timeout.connect(self._updateConnectionCounts)
+        self._connectionCountTimer.start()
+        self._updateConnectionCounts()
+        self._ui.bandwidthLimit.setValue(self._getBandwidthLimit() // 1024)
+        self._ui.bandwidthLimit.valueChanged.connect(self.setBandwidthLimit)
+        self._ui.downloadBandwidthLimit.setValue(App.FileDownloadManager.getBandwidthLimiter().getDownloadRate() // 1024)
+        self._ui.downloadBandwidthLimit.valueChanged.connect(self.setDownloadBandwidthLimit)
+        bandwidthLimitSchedule = App.FileDownloadManager.getBandwidthLimiter().getSchedule()
+        if len(bandwidthLimitSchedule) != 0:
+            self._ui.bandwidthLimitScheduled.setChecked(True)
+            self._ui.bandwidthLimitStart.setTime(QtCore.QTime.fromString(bandwidthLimitSchedule[0][0], "HH:mm"))
+            self._ui.bandwidthLimitEnd.setTime(QtCore.QTime.fromString(bandwidthLimitSchedule[0][1], "HH:mm"))
+        self._ui.bandwidthLimitScheduled.toggled.connect(self.setBandwidthLimit)
+        self._ui.bandwidthLimitStart.timeChanged.connect(self.setBandwidthLimit)
+        self._ui.bandwidthLimitEnd.timeChanged.connect(self.setBandwidthLimit)
+        self._ui.bandwidthLimitStart.setEnabled(self._ui.bandwidthLimitScheduled.isChecked())
+        self._ui.bandwidthLimitEnd.setEnabled(self._ui.bandwidthLimitScheduled.isChecked())
         self._ui.resetButton.clicked.connect(self.resetSettings)
         self.reloadBookmarkArea()
         App.GlobalDownloadManager.runningCountChangedSignal.connect(self.reload)
@@ -152,6 +176,41 @@ class Settings(QtWidgets.QWidget):
         self._ui.downloadSpeed.setValueSilent(speed)
         self._ui.speedSpinBox.setValueSilent(speed)
 
+    def setAdaptiveDownloadSpeedEnabled(self, enabled: bool) -> None:
+        App.FileDownloadManager.setAdaptivePoolSizeEnabled(enabled)
+        self._ui.speedSliderArea.setEnabled(not enabled)
+
+    def _getBandwidthLimit(self) -> int:
+        bandwidthLimitSchedule = App.FileDownloadManager.getBandwidthLimiter().getSchedule()
+        if len(bandwidthLimitSchedule) == 0:
+            return App.FileDownloadManager.getBandwidthLimiter().getRate()
+        else:
+            return bandwidthLimitSchedule[0][2]
+
+    def setBandwidthLimit(self) -> None:
+        bandwidthLimit = self._ui.bandwidthLimit.value() * 1024
+        if self._ui.bandwidthLimitScheduled.isChecked():
+            App.FileDownloadManager.getBandwidthLimiter().setRate(0)
+            App.FileDownloadManager.getBandwidthLimiter().setSchedule([(self._ui.bandwidthLimitStart.time().toString("HH:mm"), self._ui.bandwidthLimitEnd.time().toString("HH:mm"), bandwidthLimit)])
+        else:
+            App.FileDownloadManager.getBandwidthLimiter().setRate(bandwidthLimit)
+            App.FileDownloadManager.getBandwidthLimiter().setSchedule([])
+        self._ui.bandwidthLimitStart.setEnabled(self._ui.bandwidthLimitScheduled.isChecked())
+        self._ui.bandwidthLimitEnd.setEnabled(self._ui.bandwidthLimitScheduled.isChecked())
+
+    def setDownloadBandwidthLimit(self, downloadBandwidthLimit: int) -> None:
+        App.FileDownloadManager.getBandwidthLimiter().setDownloadRate(downloadBandwidthLimit * 1024)
+
+    def _updateEffectiveDownloadSpeed(self, poolSize: int) -> None:
+        self._ui.effectiveDownloadSpeed.setText(T("#Concurrent downloads: {poolSize}", poolSize=poolSize))
+
+    def _updateConnectionCounts(self) -> None:
+        connectionCounts = App.ConnectionPool.getEstimatedConnectionCounts()
+        if len(connectionCounts) == 0:
+            self._ui.connectionCounts.setText(T("#No active connections"))
+        else:
+            self._ui.connectionCounts.setText(T("#Estimated connections: {connections}", connections=", ".join(f"{host} ({count})" for host, count in sorted(connectionCounts.items()))))
+
     def resetSettings(self) -> None:
         if Utils.ask("warning", "#This will reset all settings.\nProceed?", parent=self):
             App.Preferences.reset()